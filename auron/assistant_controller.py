@@ -8,10 +8,16 @@ Discord, register new internal commands and process arbitrary user inputs.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+import re
 import threading
+import time
 import webbrowser
-from typing import Optional, Callable
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterable, Deque, Optional, Callable, Iterable, List, Tuple
 
 try:
     # Use python‑dotenv if available to load .env files into the environment
@@ -22,16 +28,33 @@ except Exception:
         return
 
 from .utils.logging_system import setup_log_system
+from .utils.ttl_cache import TTLCache
+from .utils.text import SENTENCE_END
 from .voice_recognition.voicekey_engine import VoiceKeyEngine
 from .voice_recognition.stt_engine import STTEngine
 from .commands import CommandRouter
 from .llm import OllamaClient
+from .llm import async_ollama_client
 from .tts import TTSPlayer
 
+try:
+    # Imported eagerly so the discord.py import cost is paid at startup rather
+    # than as a UI freeze on the first Discord toggle.
+    from .discord_bot.discord_bridge import DiscordBridge
+except Exception:
+    DiscordBridge = None  # type: ignore[assignment,misc]
+
 import logging
 
 logger = setup_log_system("assistant_controller")
 
+# Prompts mentioning time‑dependent topics must always reach the LLM.
+# Override with LLM_CACHE_BYPASS (a regular expression).
+_DEFAULT_CACHE_BYPASS = (
+    r"\b(?:uhr|uhrzeit|zeit|datum|heute|morgen|gestern|jetzt|wetter"
+    r"|time|date|today|tomorrow|yesterday|now|weather)\b"
+)
+
 
 class AssistantController:
     """Coordinates all subsystems of the Auron assistant."""
@@ -46,29 +69,54 @@ class AssistantController:
         self.discord_bridge: Optional["DiscordBridge"] = None
         self._discord_thread: Optional[threading.Thread] = None
 
+        # Wake events are handed to one long‑lived worker through a one‑slot
+        # deque: a wake arriving while another is pending replaces it (drop
+        # oldest), so a wake storm costs constant memory and no extra threads.
+        self._wake_q: Deque[float] = deque(maxlen=1)
+        self._wake_event = threading.Event()
+        self._wake_worker = threading.Thread(target=self._wake_worker_loop, name="WakeWorker", daemon=True)
+        self._wake_worker.start()
+
         # Initialise subsystems
         # Speech‑to‑text engine (faster‑whisper)
         stt_model_size = os.getenv("STT_MODEL_SIZE", "medium")
         stt_device = os.getenv("STT_DEVICE", "auto")
+        # Unset STT_COMPUTE_TYPE lets the engine pick dynamic int8 quantization
+        # (int8 on CPU, int8_float16 on CUDA); set it to e.g. "float16" to override.
         stt_compute_type = os.getenv("STT_COMPUTE_TYPE") or None
-        self.stt = STTEngine(model_size=stt_model_size, device=stt_device, compute_type=stt_compute_type)
-
-        # Wake word engine; the callback will be triggered on a separate thread
-        self.engine = VoiceKeyEngine(self._on_wake, cooldown_seconds=1.0)
-
-        # Concurrency lock to avoid overlapping voice processing
-        self._busy = threading.Lock()
-
-        # Command router and registration of built‑in commands
-        self.router = CommandRouter()
-        self._register_default_commands()
-
-        # Language model client
-        self.llm = OllamaClient()
+        # Environment/config values that never change while running are read
+        # once here instead of on every command or restart.
+        self._tts_voice: Optional[str] = os.getenv("TTS_VOICE") or None
+        self._discord_token: Optional[str] = os.getenv("DISCORD_TOKEN")
+        self._folder_base = os.path.expanduser("~/auron_folders")
+        self._folder_paths = tuple(
+            os.path.join(self._folder_base, name) for name in ("Documents", "Music", "Videos")
+        )
 
-        # Text‑to‑speech engine
-        tts_voice = os.getenv("TTS_VOICE") or None
-        self.tts = TTSPlayer(voice_name=tts_voice)
+        # The subsystems are independent and their construction is dominated by
+        # model/file loading, so build them concurrently: startup then takes
+        # about as long as the slowest one rather than the sum of all four.
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="init") as pool:
+            f_stt = pool.submit(
+                STTEngine, model_size=stt_model_size, device=stt_device, compute_type=stt_compute_type
+            )
+            # Wake word engine; the callback will be triggered on a separate thread
+            f_engine = pool.submit(VoiceKeyEngine, self._on_wake, cooldown_seconds=1.0)
+            # Language model client
+            f_llm = pool.submit(OllamaClient)
+            # Text‑to‑speech engine
+            f_tts = pool.submit(TTSPlayer, voice_name=self._tts_voice)
+
+            # Command router and registration of built‑in commands
+            self.router = CommandRouter()
+            self._register_default_commands()
+
+        self.stt = f_stt.result()
+        self.engine = f_engine.result()
+        self.llm = f_llm.result()
+        # Async twin of the LLM client for callers running an event loop
+        self.llm_async = self._make_async_llm()
+        self.tts = f_tts.result()
 
         # System prompt for LLM requests.  If not set in .env, fall back to a
         # sensible default instructing the model to be helpful, honest and
@@ -80,6 +128,16 @@ class AssistantController:
         )
         self.system_prompt: str = os.getenv("SYSTEM_PROMPT", default_prompt).strip()
 
+        # Cache of recent LLM replies keyed on (system prompt, user text).
+        # LLM_CACHE_SIZE=0 disables caching.
+        self._llm_cache: TTLCache[str] = TTLCache(
+            maxsize=int(os.getenv("LLM_CACHE_SIZE", "256")),
+            ttl=float(os.getenv("LLM_CACHE_TTL", "600")),
+        )
+        self._cache_bypass = re.compile(
+            os.getenv("LLM_CACHE_BYPASS", _DEFAULT_CACHE_BYPASS), re.IGNORECASE
+        )
+
     # ------------------------------------------------------------------
     # Voice recognition lifecycle
     # ------------------------------------------------------------------
@@ -100,7 +158,7 @@ class AssistantController:
                 self.voice_enabled = True
                 logger.info("Voice recognition enabled.")
             except Exception as e:
-                logger.error(f"Failed to start voice recognition: {e}", exc_info=True)
+                logger.error("Failed to start voice recognition: %s", e, exc_info=True)
 
     def stop_voice_recognition(self) -> None:
         """Stop listening for the wake word."""
@@ -127,12 +185,13 @@ class AssistantController:
         if self.discord_bridge is not None:
             logger.debug("Discord bridge already running.")
             return
-        token = os.getenv("DISCORD_TOKEN")
+        token = self._discord_token
         if not token:
             logger.warning("Cannot start Discord bridge: DISCORD_TOKEN is not set.")
             return
-        # Import here to avoid circular import at module level
-        from .discord_bot.discord_bridge import DiscordBridge
+        if DiscordBridge is None:
+            logger.error("Cannot start Discord bridge: discord.py is not installed.")
+            return
         self.discord_bridge = DiscordBridge(assistant=self, token=token, speak=self.tts_enabled)
         # Run the bot in its own thread since run() blocks
         def _run() -> None:
@@ -146,10 +205,11 @@ class AssistantController:
         if self.discord_bridge is None:
             return
         try:
-            # discord.Client.close() stops the event loop gracefully
-            self.discord_bridge.close()
+            # close() is a coroutine on the bot's own loop; shutdown() schedules
+            # it there, which stops the event loop gracefully
+            self.discord_bridge.shutdown()
         except Exception as e:
-            logger.error(f"Failed to stop Discord bridge: {e}", exc_info=True)
+            logger.error("Failed to stop Discord bridge: %s", e, exc_info=True)
         self.discord_bridge = None
         # The thread will exit once the loop is closed
         self._discord_thread = None
@@ -163,15 +223,14 @@ class AssistantController:
 
         def create_folders_handler(text: str) -> str:
             """Create a simple folder structure in the user's home directory."""
-            base_dir = os.path.expanduser("~/auron_folders")
-            subfolders = ["Documents", "Music", "Videos"]
+            base_dir = self._folder_base
             try:
-                for name in subfolders:
-                    os.makedirs(os.path.join(base_dir, name), exist_ok=True)
-                logger.info(f"Created folder structure under {base_dir}")
+                for path in self._folder_paths:
+                    os.makedirs(path, exist_ok=True)
+                logger.info("Created folder structure under %s", base_dir)
                 return f"Created folder structure under {base_dir}"  # speakable
             except Exception as e:
-                logger.error(f"Failed to create folders: {e}", exc_info=True)
+                logger.error("Failed to create folders: %s", e, exc_info=True)
                 return "An error occurred while creating folders."
 
         def open_youtube_handler(text: str) -> str:
@@ -181,7 +240,7 @@ class AssistantController:
                 logger.info("Opening YouTube in the default browser.")
                 return "Opening YouTube."
             except Exception as e:
-                logger.error(f"Failed to open YouTube: {e}", exc_info=True)
+                logger.error("Failed to open YouTube: %s", e, exc_info=True)
                 return "An error occurred while opening YouTube."
 
         def play_spotify_handler(text: str) -> str:
@@ -220,51 +279,205 @@ class AssistantController:
 
         This method routes the command through the ``CommandRouter``.  If an
         internal command matches, its handler is executed.  Otherwise the
-        command is forwarded to the language model with the system prompt
-        prepended.  The response is returned and, if TTS is enabled, also
+        command is forwarded to the language model together with the system
+        prompt.  The response is returned and, if TTS is enabled, also
         spoken.
         """
-        logger.info(f"User command: {text}")
+        logger.info("User command: %s", text)
         target, payload = self.router.route(text)
         if target == "internal":
-            response = payload or ""
-            if response and self.tts_enabled:
-                # Speak on a background thread to avoid blocking command handling.
-                threading.Thread(target=self.tts.speak, args=(response,), daemon=True).start()
-            return response
-        # Otherwise send to LLM
-        # Compose the full prompt with the system prefix
-        full_prompt = f"{self.system_prompt}\n\nUser: {text}\nAssistant:"
-        response = self.llm.generate(full_prompt)
+            return self._internal_response(payload)
+        # Otherwise send to LLM, unless the same prompt was answered recently
+        key, response = self._cached_reply(text)
+        if response is None:
+            # The static system prompt goes first as its own message so the
+            # provider can reuse the cached prefix across requests.
+            if self.tts_enabled:
+                # Stream the reply so the first sentence is spoken while the
+                # rest is still being generated.
+                response, complete = self._speak_stream(
+                    self.llm.chat_stream(system=self.system_prompt, user=text)
+                )
+            else:
+                # chat() returns "" on failure, which is never cached
+                response, complete = self.llm.chat(system=self.system_prompt, user=text), True
+            if complete:
+                self._store_reply(key, response)
         # Log the response for debugging
-        logger.info(f"Assistant response: {response}")
+        logger.info("Assistant response: %s", response)
+        return response
+
+    async def handle_command_async(self, text: str, executor: Optional[Executor] = None) -> Optional[str]:
+        """
+        Coroutine version of :meth:`handle_command` for event‑loop callers.
+
+        Routing (and any internal handler) runs on ``executor``.  The LLM
+        request is awaited on the loop through ``llm_async`` while completed
+        sentences are already being synthesised on the TTS worker.  Without
+        ``httpx`` the whole command falls back to :meth:`handle_command` on
+        ``executor``.
+        """
+        loop = asyncio.get_running_loop()
+        llm_async = self.llm_async
+        if llm_async is None:
+            return await loop.run_in_executor(executor, self.handle_command, text)
+        logger.info("User command: %s", text)
+        target, payload = await loop.run_in_executor(executor, self.router.route, text)
+        if target == "internal":
+            return self._internal_response(payload)
+        key, response = self._cached_reply(text)
+        if response is None:
+            if self.tts_enabled:
+                response, complete = await self._speak_stream_async(
+                    llm_async.chat_stream(system=self.system_prompt, user=text)
+                )
+            else:
+                response, complete = await llm_async.chat(system=self.system_prompt, user=text), True
+            if complete:
+                self._store_reply(key, response)
+        logger.info("Assistant response: %s", response)
+        return response
+
+    def _internal_response(self, payload: Optional[str]) -> str:
+        """Return (and speak, if enabled) the result of an internal command."""
+        response = payload or ""
         if response and self.tts_enabled:
-            # Speak asynchronously to avoid blocking the caller (e.g. API request)
-            threading.Thread(target=self.tts.speak, args=(response,), daemon=True).start()
+            # Speak on the TTS worker to avoid blocking command handling.
+            self.speak(response)
         return response
 
+    def _cached_reply(self, text: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Look up a recent reply to ``text``.
+
+        Returns ``(key, reply)``; ``key`` is ``None`` when the prompt must not
+        be cached and ``reply`` is ``None`` on a cache miss.  A hit is spoken
+        right away if TTS is enabled.
+        """
+        if self._cache_bypass.search(text):
+            return None, None
+        key = self._cache_key(text)
+        response = self._llm_cache.get(key)
+        if response is not None:
+            logger.debug("LLM cache hit.")
+            if response and self.tts_enabled:
+                # Speak asynchronously to avoid blocking the caller (e.g. API request)
+                self.speak(response)
+        return key, response
+
+    def _store_reply(self, key: Optional[bytes], response: str) -> None:
+        """Cache ``response`` under ``key`` (from :meth:`_cached_reply`) if possible."""
+        if key is not None and response:
+            self._llm_cache.put(key, response)
+
+    def _speak_sentences(self, pending: str) -> str:
+        """Queue every complete sentence in ``pending`` for speech; return the remainder."""
+        *sentences, pending = SENTENCE_END.split(pending)
+        for sentence in sentences:
+            if sentence.strip():
+                self.speak(sentence.strip())
+        return pending
+
+    def _speak_stream(self, chunks: Iterable[str]) -> Tuple[str, bool]:
+        """
+        Queue each complete sentence from ``chunks`` for speech.
+
+        Returns ``(text, complete)``: the text received and whether the stream
+        finished normally.  A stream that fails part way (the LLM client has
+        already logged why) yields what arrived with ``complete=False`` so the
+        truncated reply is not cached.
+        """
+        parts: List[str] = []
+        pending = ""
+        complete = True
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                pending = self._speak_sentences(pending + chunk)
+        except Exception:
+            complete = False
+        if pending.strip():
+            self.speak(pending.strip())
+        return "".join(parts).strip(), complete
+
+    async def _speak_stream_async(self, chunks: AsyncIterable[str]) -> Tuple[str, bool]:
+        """Async variant of :meth:`_speak_stream`."""
+        parts: List[str] = []
+        pending = ""
+        complete = True
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                pending = self._speak_sentences(pending + chunk)
+        except Exception:
+            complete = False
+        if pending.strip():
+            self.speak(pending.strip())
+        return "".join(parts).strip(), complete
+
+    def _cache_key(self, text: str) -> bytes:
+        """Return a compact, stable cache key for ``text`` under the current system prompt.
+
+        Case and runs of whitespace are ignored, so "What time is it" and
+        "what  time is it" share an entry.
+        """
+        normalized = " ".join(text.casefold().split())
+        raw = f"{self.system_prompt}\x00{normalized}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def clear_reply_cache(self) -> None:
+        """Forget all cached LLM replies."""
+        self._llm_cache.clear()
+        logger.info("LLM reply cache cleared.")
+
+    def speak(self, text: str) -> None:
+        """Queue ``text`` for speech; the TTS player synthesises and plays it in the background."""
+        self.tts.speak(text)
+
+    def close(self) -> None:
+        """Release resources held by the controller (TTS, STT worker and LLM session)."""
+        self.tts.close()
+        self.stt.close()
+        self.llm.close()
+        if self.llm_async is not None:
+            self.llm_async.close()
+
     # ------------------------------------------------------------------
     # Restartable subsystems
     # ------------------------------------------------------------------
     def restart_tts(self) -> bool:
         """Reinitialise the TTS engine. Returns True if successful."""
         try:
-            tts_voice = os.getenv("TTS_VOICE") or None
-            self.tts = TTSPlayer(voice_name=tts_voice)
+            old, self.tts = self.tts, TTSPlayer(voice_name=self._tts_voice)
+            old.close()
             logger.info("TTS engine restarted.")
             return True
         except Exception as e:
-            logger.error(f"Failed to restart TTS engine: {e}", exc_info=True)
+            logger.error("Failed to restart TTS engine: %s", e, exc_info=True)
             return False
 
+    @staticmethod
+    def _make_async_llm() -> Optional["async_ollama_client.AsyncOllamaClient"]:
+        """Create the async LLM client, or return None if httpx is unavailable."""
+        if not async_ollama_client.AVAILABLE:
+            logger.debug("httpx not installed; async commands use a worker thread.")
+            return None
+        return async_ollama_client.AsyncOllamaClient()
+
     def restart_llm(self) -> bool:
         """Reinitialise the language model client. Returns True if successful."""
         try:
-            self.llm = OllamaClient()
+            old, self.llm = self.llm, OllamaClient()
+            old.close()
+            old_async, self.llm_async = self.llm_async, self._make_async_llm()
+            if old_async is not None:
+                # Its pooled connections belong to the loop that used it
+                old_async.close()
+            self._llm_cache.clear()
             logger.info("LLM client restarted.")
             return True
         except Exception as e:
-            logger.error(f"Failed to restart LLM client: {e}", exc_info=True)
+            logger.error("Failed to restart LLM client: %s", e, exc_info=True)
             return False
 
     # ------------------------------------------------------------------
@@ -274,18 +487,37 @@ class AssistantController:
         """
         Callback executed when the wake word is detected.
 
-        This method offloads the recording and transcription pipeline to a
-        worker thread to avoid blocking the audio callback.
+        This method hands the recording and transcription pipeline to the
+        wake worker thread to avoid blocking the audio callback.
         """
-        if not self._busy.acquire(blocking=False):
-            logger.debug("Wakeword detected but a command is already being processed. Ignoring.")
-            return
-        threading.Thread(target=self._process_wake_event, daemon=True).start()
+        # deque.append is atomic and never blocks the detection thread
+        if self._wake_q:
+            logger.debug("Wakeword detected while another wake is pending; dropping the older one.")
+        self._wake_q.append(time.monotonic())
+        self._wake_event.set()
+
+    def _wake_worker_loop(self) -> None:
+        """Process queued wake events one at a time for the controller's lifetime."""
+        while True:
+            self._wake_event.wait()
+            self._wake_event.clear()
+            try:
+                detected_at = self._wake_q.popleft()
+            except IndexError:
+                continue
+            waited = time.monotonic() - detected_at
+            if waited > 1.0:
+                logger.debug("Processing wake event queued %.1f s ago.", waited)
+            try:
+                self._process_wake_event()
+            except Exception as e:
+                logger.error("Unhandled error while processing wake event: %s", e, exc_info=True)
 
     def _process_wake_event(self) -> None:
         """
         Record, transcribe and handle the user's speech after the wake word.
         """
+        audio = None
         try:
             logger.info("Wake word recognized. Preparing to record command…")
             # Pause the wakeword engine to free the microphone
@@ -295,27 +527,22 @@ class AssistantController:
                 audio = self.stt.record_until_silence()
                 logger.info("Voice command recording finished.")
             except Exception as e:
-                logger.error(f"Error during voice recording: {e}", exc_info=True)
-                audio = None
+                logger.error("Error during voice recording: %s", e, exc_info=True)
         finally:
             # Resume listening as soon as possible
             try:
                 self.engine.start()
             except Exception as e:
-                logger.error(f"Failed to resume wakeword engine: {e}", exc_info=True)
+                logger.error("Failed to resume wakeword engine: %s", e, exc_info=True)
         # Process the recorded audio
         if audio is None or (hasattr(audio, "size") and audio.size == 0):
             logger.warning("No audio captured for transcription.")
-            self._busy.release()
             return
         try:
-            # Transcribe speech to text
-            text = self.stt.transcribe(audio, language="de")
+            # Transcribe speech to text on the STT worker
+            text = self.stt.transcribe_async(audio, language="de").result()
             if text:
-                # Dispatch to router/LLM
-                response = self.handle_command(text)
-                # Optionally integrate with GUI/Discord: the GUI will pick up logs
+                # Dispatch to router/LLM; the GUI/web UI pick up the result from logs
+                self.handle_command(text)
         except Exception as e:
-            logger.error(f"Speech transcription failed: {e}", exc_info=True)
-        finally:
-            self._busy.release()
\ No newline at end of file
+            logger.error("Speech transcription failed: %s", e, exc_info=True)
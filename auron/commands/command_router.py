@@ -8,22 +8,45 @@ functions.  Patterns are compiled as case‑insensitive regular expressions.
 If no pattern matches, the router indicates that the text should be sent to
 the LLM. Each handler should accept the full user text and return either a
 string response or ``None`` if it performs an action without text output.
+
+String patterns are additionally merged into a single alternation so that
+``route`` needs only one regex search to decide whether any command matches.
+When the optional ``hyperscan`` package is installed, the same patterns are
+compiled into a Hyperscan database instead and scanned in a single pass.
+
+Case‑insensitivity for string patterns is handled by lowercasing the user
+text once per ``route`` call.  Patterns whose literals are already lowercase
+(all built‑in commands) are then compiled without ``re.IGNORECASE`` and skip
+the per‑character case folding inside the regex engine.
 """
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Callable, Pattern, List, Tuple, Optional
+import threading
+from typing import Any, Callable, Pattern, List, Tuple, Optional
+
+try:
+    # Optional: Intel Hyperscan for single-pass multi-pattern matching
+    import hyperscan  # type: ignore[import]
+except Exception:
+    hyperscan = None  # type: ignore[assignment]
 
 CommandHandler = Callable[[str], Optional[str]]
 
+_BACKREF = re.compile(r"\\[1-9]")
+_ESCAPE = re.compile(r"\\.", re.DOTALL)
 
-@dataclass
-class Command:
-    """Represents an internal command and its handler."""
 
-    pattern: Pattern[str]
-    handler: CommandHandler
+def _is_lowercase(source: str) -> bool:
+    """Return True if ``source`` has no uppercase literals outside escapes like ``\\S``."""
+    stripped = _ESCAPE.sub("", source)
+    return stripped == stripped.lower()
+
+
+def _on_hs_match(id_: int, start: int, end: int, flags: int, context: List[int]) -> Optional[bool]:
+    """Hyperscan match callback collecting the ids of matching patterns."""
+    context.append(id_)
+    return None  # keep scanning; a lower id may still match later in the text
 
 
 class CommandRouter:
@@ -37,10 +60,35 @@ class CommandRouter:
     containing the handler's return value. If no command matches, the router
     returns ``("llm", text)`` indicating the utterance should be passed to
     the language model unchanged.
+
+    All patterns registered as strings are combined into one union regex of
+    named groups (``(?P<c0>...)|(?P<c1>...)|...``) which is rebuilt lazily on
+    the first ``route`` call after a registration.  Pre-compiled patterns
+    cannot be merged (their flags may differ) and are checked individually.
+    If ``hyperscan`` is available and accepts every merged pattern, a
+    Hyperscan database replaces the union regex.
+
+    Commands are stored as parallel lists (compiled pattern, handler, raw
+    source) indexed by registration order, which keeps the per‑pattern loops
+    free of per‑object attribute lookups.
     """
 
     def __init__(self) -> None:
-        self._commands: List[Command] = []
+        self._patterns: List[Pattern[str]] = []
+        self._handlers: List[CommandHandler] = []
+        # Raw pattern source, or None for caller‑compiled patterns
+        self._sources: List[Optional[str]] = []
+        # UTF‑8 encoded sources, computed once for Hyperscan rebuilds
+        self._source_bytes: List[Optional[bytes]] = []
+        self._union: Optional[Pattern[str]] = None
+        self._hs_db: Any = None
+        # Hyperscan scratch space must not be shared by concurrent scans, and
+        # route() is called from several worker threads; each thread keeps
+        # its own scratch for the current database.
+        self._hs_local = threading.local()
+        self._dirty = True
+        # Indices of commands whose pattern could not be merged into the union
+        self._unmerged: List[int] = []
 
     def add_internal(self, pattern: str | Pattern[str], handler: CommandHandler) -> None:
         """
@@ -49,14 +97,126 @@ class CommandRouter:
         Parameters
         ----------
         pattern:
-            A regular expression or string. If a string is provided it will be
-            compiled with the ``re.IGNORECASE`` flag.
+            A regular expression or string. String patterns match case‑
+            insensitively: they are tested against the lowercased text and
+            compiled with ``re.IGNORECASE`` only if they contain uppercase
+            literals.
         handler:
             A callable invoked with the full user utterance when the pattern
             matches. It should return a response string or ``None``.
         """
-        regex = re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
-        self._commands.append(Command(regex, handler))
+        if isinstance(pattern, str):
+            flags = 0 if _is_lowercase(pattern) else re.IGNORECASE
+            self._patterns.append(re.compile(pattern, flags))
+            self._sources.append(pattern)
+            self._source_bytes.append(pattern.encode("utf-8"))
+        else:
+            self._patterns.append(pattern)
+            self._sources.append(None)
+            self._source_bytes.append(None)
+        self._handlers.append(handler)
+        self._dirty = True
+
+    def _rebuild(self) -> None:
+        """Recompile the union regex (or Hyperscan database) from string patterns."""
+        parts: List[str] = []
+        self._unmerged = []
+        for idx, (pat, src) in enumerate(zip(self._patterns, self._sources)):
+            # Numbered backreferences would point at the wrong group once
+            # the pattern is nested inside the union.
+            if src is None or _BACKREF.search(src):
+                self._unmerged.append(idx)
+            elif pat.flags & re.IGNORECASE:
+                parts.append(f"(?P<c{idx}>(?i:{src}))")
+            else:
+                parts.append(f"(?P<c{idx}>{src})")
+        self._dirty = False
+        self._hs_db = self._build_hyperscan()
+        if self._hs_db is not None:
+            self._union = None
+            return
+        try:
+            self._union = re.compile("|".join(parts)) if parts else None
+        except re.error:
+            # e.g. duplicate group names across patterns; check each one instead
+            self._union = None
+            self._unmerged = list(range(len(self._patterns)))
+
+    def _build_hyperscan(self) -> Any:
+        """Compile merged patterns into a Hyperscan database, or return ``None``."""
+        if hyperscan is None:
+            return None
+        ids = [idx for idx in range(len(self._patterns)) if idx not in self._unmerged]
+        if not ids:
+            return None
+        base = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+        flags = [
+            base | hyperscan.HS_FLAG_CASELESS if self._patterns[idx].flags & re.IGNORECASE else base
+            for idx in ids
+        ]
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[self._source_bytes[idx] for idx in ids],
+                ids=ids,
+                elements=len(ids),
+                flags=flags,
+            )
+            return db
+        except Exception:
+            # Unsupported construct (e.g. lookaround); use the union regex instead
+            return None
+
+    def _match_index(self, text: str) -> Optional[int]:
+        """Return the index of the first registered command matching ``text``."""
+        if self._dirty:
+            self._rebuild()
+        # Lowercase once; every string pattern is matched against this copy
+        lowered = text.lower()
+        db = self._hs_db
+        if db is not None:
+            hits: List[int] = []
+            db.scan(
+                lowered.encode("utf-8"),
+                match_event_handler=_on_hs_match,
+                context=hits,
+                scratch=self._hs_scratch(db),
+            )
+            if hits:
+                best = min(hits)
+                for idx in self._unmerged:
+                    if idx >= best:
+                        break
+                    if self._search(idx, text, lowered):
+                        return idx
+                return best
+        elif self._union is not None:
+            m = self._union.search(lowered)
+            if m is not None:
+                best = int(m.lastgroup[1:])  # type: ignore[index]
+                # The union reports the leftmost match; an earlier registered
+                # command may still match further right and must win.
+                for idx in range(best):
+                    if self._search(idx, text, lowered):
+                        return idx
+                return best
+        for idx in self._unmerged:
+            if self._search(idx, text, lowered):
+                return idx
+        return None
+
+    def _hs_scratch(self, db: Any) -> Any:
+        """Return this thread's Hyperscan scratch for ``db``, allocating it on first use."""
+        local = self._hs_local
+        if getattr(local, "db", None) is not db:
+            local.scratch = hyperscan.Scratch(db)
+            local.db = db
+        return local.scratch
+
+    def _search(self, idx: int, text: str, lowered: str) -> bool:
+        """Test a single command; caller‑compiled patterns see the original text."""
+        subject = text if self._sources[idx] is None else lowered
+        return self._patterns[idx].search(subject) is not None
 
     def route(self, text: str) -> Tuple[str, Optional[str]]:
         """
@@ -67,8 +227,8 @@ class CommandRouter:
         the handler's return value (for internal commands) or the original text
         (for LLM commands).
         """
-        for cmd in self._commands:
-            if cmd.pattern.search(text):
-                # Matched internal command
-                return ("internal", cmd.handler(text))
+        idx = self._match_index(text)
+        if idx is not None:
+            # Matched internal command
+            return ("internal", self._handlers[idx](text))
         return ("llm", text)
\ No newline at end of file
@@ -5,11 +5,17 @@ This bot listens for messages, routes them through the assistant controller and
 relays responses back to Discord.  Voice support is optional and can be
 enabled via configuration.  The implementation uses the ``discord.py``
 library and runs in its own asynchronous event loop.
+
+LLM requests are awaited on the bot's loop via the assistant's async client;
+blocking work (routing, internal commands, or everything when ``httpx`` is
+missing) runs on a dedicated thread pool so that it never competes with
+discord.py for the loop's default executor.
 """
 from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import discord
@@ -43,9 +49,10 @@ class DiscordBridge(discord.Client):
         self.token = token
         self.speak_enabled = speak
         self.listen_enabled = listen
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="discord-assistant")
 
     async def on_ready(self) -> None:
-        logger.info(f"Discord bot ready: logged in as {self.user} (ID: {self.user.id})")
+        logger.info("Discord bot ready: logged in as %s (ID: %s)", self.user, self.user.id)
 
     async def on_message(self, message: discord.Message) -> None:
         # Ignore messages sent by the bot itself
@@ -54,21 +61,39 @@ class DiscordBridge(discord.Client):
         text = message.content.strip()
         if not text:
             return
-        logger.debug(f"Discord message received: {text}")
-        loop = asyncio.get_event_loop()
-        # Offload processing of the command to the assistant on a thread pool
-        response: Optional[str] = await loop.run_in_executor(None, self.assistant.handle_command, text)
-        if response:
-            try:
-                await message.channel.send(response)
-            except Exception as e:
-                logger.error(f"Failed to send Discord message: {e}", exc_info=True)
-        # Optionally speak the response via TTS
-        if response and self.speak_enabled:
+        logger.debug("Discord message received: %s", text)
+        # Blocking parts of the command run on our own pool
+        response: Optional[str] = await self.assistant.handle_command_async(text, self._executor)
+        if not response:
+            return
+        # speak() only queues the text, so the channel reply does not wait on TTS
+        if self.speak_enabled:
             try:
-                await loop.run_in_executor(None, self.assistant.tts.speak, response)
+                self.assistant.speak(response)
             except Exception as e:
-                logger.error(f"Failed to speak Discord response: {e}", exc_info=True)
+                logger.error("Failed to speak Discord response: %s", e, exc_info=True)
+        try:
+            await message.channel.send(response)
+        except Exception as e:
+            logger.error("Failed to send Discord message: %s", e, exc_info=True)
+
+    async def close(self) -> None:
+        """Disconnect from Discord and release the assistant worker pool."""
+        try:
+            await super().close()
+            llm_async = getattr(self.assistant, "llm_async", None)
+            if llm_async is not None:
+                await llm_async.aclose()
+        finally:
+            self._executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Thread-safe request to close the bot from outside its event loop."""
+        loop = getattr(self, "loop", None)
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.close(), loop)
+        else:
+            self._executor.shutdown(wait=False)
 
     def run_bot(self) -> None:
         """Start the Discord bot event loop.  This method blocks until closed."""
@@ -76,4 +101,4 @@ class DiscordBridge(discord.Client):
             logger.info("Starting Discord bot…")
             self.run(self.token)
         except Exception as e:
-            logger.error(f"Error while running Discord bot: {e}", exc_info=True)
\ No newline at end of file
+            logger.error("Error while running Discord bot: %s", e, exc_info=True)
\ No newline at end of file
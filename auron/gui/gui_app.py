@@ -5,21 +5,64 @@ This module defines the ``GUIApp`` class which builds a simple Tkinter
 interface.  It presents conversation history, a user input field, a set of
 control buttons and a live log view.  Incoming and outgoing messages are
 displayed in the conversation pane and logs are streamed into the log pane
-via a custom logging handler.
+via a ``DeferredQueueHandler`` on the root logger, which only merges each
+record's args on the logging thread; a ``QueueListener`` thread formats the
+records (including tracebacks) so that logging threads never wait on the GUI.
+
+Chat and log lines are buffered and written to the widgets in batches: all
+lines arriving within a short interval are inserted with a single Tk call
+per pane, so a chatty logger causes one redraw per batch rather than per line.
+Both panes are trimmed to a maximum number of lines (``AURON_LOG_MAX_LINES``
+for the log pane, ``AURON_CHAT_MAX_LINES`` for the chat pane) so that Tk's
+layout cost stays bounded during long sessions.
 """
 from __future__ import annotations
 
 import logging
 import os
+import queue
 import threading
-from typing import Optional
+from collections import deque
+from logging.handlers import QueueListener
+from typing import Callable, Deque, Optional, Tuple
 
 import tkinter as tk
 from tkinter import ttk
 from tkinter import scrolledtext
 
+from ..utils.logging_system import DeferredQueueHandler
+
 logger = logging.getLogger(__name__)
 
+# Coalescing interval for buffered chat/log lines
+_FLUSH_INTERVAL_MS = 30
+
+# Default line caps for the log and chat panes
+_DEFAULT_LOG_MAX_LINES = 2000
+_DEFAULT_CHAT_MAX_LINES = 5000
+
+# Third‑party loggers whose DEBUG/INFO chatter is not useful in the log pane
+_NOISY_LOGGERS = ("urllib3", "requests", "httpx", "httpcore", "chatterbox", "sounddevice")
+
+
+class _GuiSink(logging.Handler):
+    """Handler run by the GUI's QueueListener; formats records into the log buffer."""
+
+    def __init__(self, append: Callable[[str], None], level: int = logging.DEBUG) -> None:
+        super().__init__(level)
+        self._append = append
+        self.setFormatter(
+            logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s", "%H:%M:%S")
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < self.level:
+            return
+        try:
+            self._append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
 
 class GUIApp:
     """Tkinter GUI for the Auron assistant."""
@@ -55,12 +98,24 @@ class GUIApp:
         # Toggle Discord integration
         self.discord_btn = ttk.Button(self.buttons_frame, text="Toggle Discord", command=self._toggle_discord)
         self.discord_btn.grid(row=0, column=2, padx=5, pady=2)
+        # Scroll lock: keep the current view instead of following new lines
+        self.scroll_lock = tk.BooleanVar(master=self.root, value=False)
+        self.scroll_lock_btn = ttk.Checkbutton(self.buttons_frame, text="Scroll Lock", variable=self.scroll_lock)
+        self.scroll_lock_btn.grid(row=0, column=3, padx=5, pady=2)
 
         # Log pane
         self.log_text = scrolledtext.ScrolledText(self.root, wrap=tk.WORD, height=10)
         self.log_text.configure(state=tk.DISABLED)
         self.log_text.grid(row=3, column=0, columnspan=2, padx=5, pady=5, sticky="nsew")
 
+        # Pending lines, filled from any thread and drained on the Tk thread
+        self._chat_buf: Deque[Tuple[str, str]] = deque()
+        self._log_buf: Deque[str] = deque()
+        self._buf_lock = threading.Lock()
+        self._flush_scheduled = False
+        self.max_log_lines = int(os.getenv("AURON_LOG_MAX_LINES", str(_DEFAULT_LOG_MAX_LINES)))
+        self.max_chat_lines = int(os.getenv("AURON_CHAT_MAX_LINES", str(_DEFAULT_CHAT_MAX_LINES)))
+
         # Configure row/column weights for resizing
         self.root.rowconfigure(0, weight=3)
         self.root.rowconfigure(3, weight=1)
@@ -68,24 +123,37 @@ class GUIApp:
         self.root.columnconfigure(1, weight=0)
 
         # Attach log handler so logs appear in GUI
+        self._log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._log_handler: Optional[DeferredQueueHandler] = None
+        self._log_listener: Optional[QueueListener] = None
         self._attach_log_handler()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ---------------------------------------------------------------------
     # Logging
     # ---------------------------------------------------------------------
     def _attach_log_handler(self) -> None:
-        """Attach a logging handler to direct logs into the GUI log pane."""
-        handler = logging.Handler()
-        handler.setLevel(logging.DEBUG)
+        """Route root logger records to the GUI log pane through a queue."""
+        level = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+        for name in _NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
+        # Filtering on the QueueHandler drops records before they are copied
+        # and queued; the sink repeats the check for handlers added later.
+        # Same handler as the console pipeline: only args are merged here
+        self._log_handler = DeferredQueueHandler(self._log_queue)
+        self._log_handler.setLevel(level)
+        self._log_listener = QueueListener(self._log_queue, _GuiSink(self.append_log, level))
+        self._log_listener.start()
+        logging.getLogger().addHandler(self._log_handler)
 
-        def emit(record: logging.LogRecord) -> None:
-            msg = handler.format(record)
-            self.append_log(msg)
-
-        handler.emit = emit  # type: ignore[assignment]
-        formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s", "%H:%M:%S")
-        handler.setFormatter(formatter)
-        logging.getLogger().addHandler(handler)
+    def _detach_log_handler(self) -> None:
+        """Remove the GUI log handler and stop its listener thread."""
+        if self._log_handler is not None:
+            logging.getLogger().removeHandler(self._log_handler)
+            self._log_handler = None
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
 
     # ---------------------------------------------------------------------
     # User input handling
@@ -111,23 +179,65 @@ class GUIApp:
     # ---------------------------------------------------------------------
     def append_chat(self, role: str, text: str) -> None:
         """Append a line to the chat pane in a thread‑safe manner."""
-        def _append() -> None:
-            self.chat_text.configure(state=tk.NORMAL)
-            self.chat_text.insert(tk.END, f"{role}: {text}\n")
-            self.chat_text.see(tk.END)
-            self.chat_text.configure(state=tk.DISABLED)
-
-        self.root.after(0, _append)
+        with self._buf_lock:
+            self._chat_buf.append((role, text))
+            self._schedule_flush()
 
     def append_log(self, text: str) -> None:
         """Append a log line to the log pane in a thread‑safe manner."""
-        def _append() -> None:
-            self.log_text.configure(state=tk.NORMAL)
-            self.log_text.insert(tk.END, f"{text}\n")
-            self.log_text.see(tk.END)
-            self.log_text.configure(state=tk.DISABLED)
+        with self._buf_lock:
+            self._log_buf.append(text)
+            self._schedule_flush()
 
-        self.root.after(0, _append)
+    def _schedule_flush(self) -> None:
+        """Schedule one flush for everything buffered so far.  Caller holds ``_buf_lock``."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(_FLUSH_INTERVAL_MS, self._flush)
+
+    def _flush(self) -> None:
+        """Write all buffered lines to their panes (runs on the Tk thread)."""
+        with self._buf_lock:
+            chat = list(self._chat_buf)
+            logs = list(self._log_buf)
+            self._chat_buf.clear()
+            self._log_buf.clear()
+            self._flush_scheduled = False
+        # Each pane gets one pre‑joined block, i.e. a single insert per flush
+        follow = not self.scroll_lock.get()
+        if chat:
+            self._append_block(
+                self.chat_text,
+                "".join([f"{role}: {text}\n" for role, text in chat]),
+                self.max_chat_lines,
+                follow,
+            )
+        if logs:
+            self._append_block(self.log_text, "\n".join(logs) + "\n", self.max_log_lines, follow)
+
+    @staticmethod
+    def _append_block(widget: scrolledtext.ScrolledText, block: str, max_lines: int, follow: bool = True) -> None:
+        """Insert ``block`` at the end of a read‑only text widget.
+
+        The oldest lines are deleted once the widget holds more than
+        ``max_lines`` lines (a non‑positive cap disables trimming).  With
+        ``follow`` the view scrolls to the new end, unless the user has
+        scrolled up; otherwise it is left alone (scroll lock).
+        """
+        # Only auto‑follow if the view was at the bottom before this insert
+        follow = follow and widget.yview()[1] >= 1.0
+        widget.configure(state=tk.NORMAL)
+        widget.insert(tk.END, block)
+        if max_lines > 0:
+            # "end-1c" sits on the empty line after the trailing newline
+            lines = int(widget.index("end-1c").split(".")[0]) - 1
+            if lines > max_lines:
+                widget.delete("1.0", f"{lines - max_lines + 1}.0")
+        if follow:
+            # O(1) compared to see(END), which recomputes line metrics
+            widget.mark_set(tk.INSERT, tk.END)
+            widget.yview_moveto(1.0)
+        widget.configure(state=tk.DISABLED)
 
     # ---------------------------------------------------------------------
     # Button callbacks
@@ -163,6 +273,14 @@ class GUIApp:
     # ---------------------------------------------------------------------
     # Run loop
     # ---------------------------------------------------------------------
+    def _on_close(self) -> None:
+        """Window close handler: stop log forwarding, then destroy the window."""
+        self._detach_log_handler()
+        self.root.destroy()
+
     def run(self) -> None:
         """Enter the Tkinter main loop.  Returns when the window is closed."""
-        self.root.mainloop()
\ No newline at end of file
+        try:
+            self.root.mainloop()
+        finally:
+            self._detach_log_handler()
\ No newline at end of file
@@ -3,8 +3,11 @@
 This package currently provides an ``OllamaClient`` for interacting with a
 locally hosted Ollama server using the LLaMA 3 model.  Additional backends
 can be added by implementing a similar interface with a ``generate`` method.
+``AsyncOllamaClient`` offers the same API as coroutines when ``httpx`` is
+installed.
 """
 
 from .ollama_client import OllamaClient  # noqa: F401
+from .async_ollama_client import AsyncOllamaClient  # noqa: F401
 
-__all__ = ["OllamaClient"]
\ No newline at end of file
+__all__ = ["OllamaClient", "AsyncOllamaClient"]
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Asynchronous Ollama client.
+
+``AsyncOllamaClient`` mirrors :class:`~auron.llm.ollama_client.OllamaClient`
+on top of ``httpx.AsyncClient`` so LLM requests can be awaited from an event
+loop (e.g. the Discord bot's) without tying up a worker thread per request.
+The HTTP client is created once per event loop and reused, keeping the
+connection to the Ollama server alive between prompts.  ``httpx`` is an
+optional dependency; check :data:`AVAILABLE` before constructing a client.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, Optional
+
+try:
+    import httpx  # type: ignore[import]
+except Exception:
+    httpx = None  # type: ignore[assignment]
+
+from .ollama_client import _chat_url_for, _json_loads
+
+logger = logging.getLogger(__name__)
+
+#: Whether the optional ``httpx`` dependency is installed
+AVAILABLE = httpx is not None
+
+
+class AsyncOllamaClient:
+    """Async client for the Ollama generate and chat APIs."""
+
+    def __init__(self, model: Optional[str] = None, base_url: Optional[str] = None, timeout: float = 120.0) -> None:
+        if httpx is None:
+            raise RuntimeError("httpx is not installed; AsyncOllamaClient is unavailable.")
+        self.model = model or os.getenv("LLM_MODEL", "llama3")
+        default_url = "http://localhost:11434/api/generate"
+        self.base_url = base_url or os.getenv("OLLAMA_URL", default_url)
+        self.chat_url = os.getenv("OLLAMA_CHAT_URL") or _chat_url_for(self.base_url)
+        self.timeout = timeout
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        self._system_message: Optional[Dict[str, str]] = None
+        # httpx.AsyncClient is bound to the loop it was created on
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the HTTP client for the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def generate(self, prompt: str) -> str:
+        """Return the response for ``prompt`` or an empty string on failure."""
+        try:
+            return "".join([part async for part in self.generate_stream(prompt)]).strip()
+        except Exception:
+            return ""  # already logged by generate_stream
+
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Yield the response for ``prompt`` fragment by fragment; failures are logged and re‑raised."""
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+        }
+        try:
+            async with self._get_client().stream("POST", self.base_url, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    text = chunk.get("response")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
+        except Exception as e:
+            logger.error("Async Ollama request failed: %s", e, exc_info=True)
+            raise
+
+    async def chat(self, system: str, user: str) -> str:
+        """Return the reply to ``user`` under ``system`` or an empty string on failure."""
+        try:
+            return "".join([part async for part in self.chat_stream(system, user)]).strip()
+        except Exception:
+            return ""  # already logged by chat_stream
+
+    async def chat_stream(self, system: str, user: str) -> AsyncIterator[str]:
+        """Yield the reply to ``user`` fragment by fragment through ``/api/chat``; failures are re‑raised."""
+        system_message = self._system_message
+        if system_message is None or system_message["content"] != system:
+            system_message = self._system_message = {"role": "system", "content": system}
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [system_message, {"role": "user", "content": user}],
+            "stream": True,
+            "keep_alive": self.keep_alive,
+        }
+        try:
+            async with self._get_client().stream("POST", self.chat_url, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    message = chunk.get("message")
+                    if isinstance(message, dict) and message.get("content"):
+                        yield str(message["content"])
+                    if chunk.get("done"):
+                        break
+        except Exception as e:
+            logger.error("Async Ollama chat request failed: %s", e, exc_info=True)
+            raise
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if it belongs to the running loop."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._client_loop = None
+
+    def close(self) -> None:
+        """Schedule :meth:`aclose` on the loop owning the HTTP client; callable from any thread.
+
+        If that loop is no longer running the client cannot be closed
+        cleanly and is dropped.
+        """
+        loop = self._client_loop
+        if self._client is None or loop is None or loop.is_closed() or not loop.is_running():
+            self._client = None
+            self._client_loop = None
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop)
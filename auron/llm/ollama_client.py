@@ -5,27 +5,90 @@ This module provides a thin wrapper around the local Ollama HTTP API.  It
 defaults to using the LLaMA 3 model but can be configured via environment
 variables.  If the request fails, the client logs an error and returns an
 empty string to the caller.
+
+``chat`` sends the system prompt as a separate message through ``/api/chat``
+so the static prefix stays byte‑identical between requests and Ollama can
+reuse its KV cache for it instead of re‑evaluating the system prompt.
+
+Requests go through one ``requests.Session`` per client so the keep‑alive
+connection to the Ollama server is reused rather than reopened per prompt.
+
+Responses are streamed: ``generate_stream`` and ``chat_stream`` yield text
+fragments as Ollama produces them, so callers can display or speak the first
+sentence while the rest is still being generated.  ``generate`` and ``chat``
+join the stream for callers that want the complete reply.
+
+On construction the client fires an empty background request so Ollama
+loads the model while the rest of the assistant starts up; every request
+passes ``keep_alive`` (``OLLAMA_KEEP_ALIVE``, default ``30m``) so the model
+stays resident between prompts.
 """
 from __future__ import annotations
 
+import json
 import os
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    # orjson parses the per‑token NDJSON chunks in C; stdlib json is the fallback
+    from orjson import loads as _json_loads  # type: ignore[import]
+except Exception:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+def _chat_url_for(generate_url: str) -> str:
+    """Derive the ``/api/chat`` endpoint from a ``/api/generate`` URL."""
+    base = generate_url.rstrip("/")
+    if base.endswith("/api/chat"):
+        return base
+    if base.endswith("/api/generate"):
+        base = base[: -len("/api/generate")]
+    return f"{base}/api/chat"
+
+
 class OllamaClient:
     """Simple client for the Ollama generate API."""
 
-    def __init__(self, model: Optional[str] = None, base_url: Optional[str] = None, timeout: float = 120.0) -> None:
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 120.0,
+        *,
+        warm_up: bool = True,
+    ) -> None:
         # Determine the model name and base URL from environment variables if not provided
         self.model = model or os.getenv("LLM_MODEL", "llama3")
         default_url = "http://localhost:11434/api/generate"
         self.base_url = base_url or os.getenv("OLLAMA_URL", default_url)
+        self.chat_url = os.getenv("OLLAMA_CHAT_URL") or _chat_url_for(self.base_url)
         self.timeout = timeout
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        # Persistent session: one small pool of keep‑alive connections to the server
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # System message reused across chat() calls while the prompt is unchanged
+        self._system_message: Optional[Dict[str, str]] = None
+        if warm_up:
+            threading.Thread(target=self._warm_up, name="OllamaWarmUp", daemon=True).start()
+
+    def _warm_up(self) -> None:
+        """Ask Ollama to load the model; an empty prompt generates no tokens."""
+        payload: Dict[str, Any] = {"model": self.model, "prompt": "", "stream": False, "keep_alive": self.keep_alive}
+        try:
+            self._session.post(self.base_url, json=payload, timeout=self.timeout).raise_for_status()
+            logger.debug("Ollama model %s warmed up.", self.model)
+        except Exception as e:
+            logger.debug("Ollama warm-up request failed: %s", e)
 
     def generate(self, prompt: str) -> str:
         """
@@ -41,20 +104,94 @@ class OllamaClient:
         str
             The model's response or an empty string on failure.
         """
-        payload: Dict[str, Any] = {"model": self.model, "prompt": prompt, "stream": False}
         try:
-            response = requests.post(self.base_url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            # The API may return different shapes depending on version
-            if isinstance(data, dict):
-                if "response" in data:
-                    return str(data["response"]).strip()
-                # compatibility with generic chat API
-                if "choices" in data and data["choices"]:
-                    choice = data["choices"][0]
-                    return str(choice.get("text", "")).strip()
-            return ""
+            return "".join(self.generate_stream(prompt)).strip()
+        except Exception:
+            return ""  # already logged by generate_stream
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Yield the response for ``prompt`` fragment by fragment.
+
+        If the request fails, even part way through, the error is logged and
+        re‑raised so callers can tell a truncated reply from a complete one.
+        """
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+        }
+        try:
+            with self._session.post(self.base_url, json=payload, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    text = chunk.get("response")
+                    if text is None and chunk.get("choices"):
+                        # compatibility with generic completion APIs
+                        text = chunk["choices"][0].get("text")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
         except Exception as e:
-            logger.error(f"Ollama request failed: {e}", exc_info=True)
-            return ""
\ No newline at end of file
+            logger.error("Ollama request failed: %s", e, exc_info=True)
+            raise
+
+    def chat(self, system: str, user: str) -> str:
+        """
+        Generate a reply to ``user`` with ``system`` as the system message.
+
+        The system prompt is sent as its own message ahead of the dynamic
+        user text, keeping the prompt prefix identical across requests.
+
+        Returns
+        -------
+        str
+            The model's reply or an empty string on failure.
+        """
+        try:
+            return "".join(self.chat_stream(system, user)).strip()
+        except Exception:
+            return ""  # already logged by chat_stream
+
+    def chat_stream(self, system: str, user: str) -> Iterator[str]:
+        """
+        Yield the reply to ``user`` fragment by fragment (see :meth:`chat`).
+
+        Failures are logged and re‑raised, as in :meth:`generate_stream`.
+        """
+        system_message = self._system_message
+        if system_message is None or system_message["content"] != system:
+            system_message = self._system_message = {"role": "system", "content": system}
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [system_message, {"role": "user", "content": user}],
+            "stream": True,
+            "keep_alive": self.keep_alive,
+        }
+        try:
+            with self._session.post(self.chat_url, json=payload, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    message = chunk.get("message")
+                    if message is None and chunk.get("choices"):
+                        # compatibility with OpenAI-style chat chunks
+                        message = chunk["choices"][0].get("delta") or chunk["choices"][0].get("message")
+                    if isinstance(message, dict) and message.get("content"):
+                        yield str(message["content"])
+                    if chunk.get("done"):
+                        break
+        except Exception as e:
+            logger.error("Ollama chat request failed: %s", e, exc_info=True)
+            raise
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
@@ -2,25 +2,30 @@
 Entry point for the Auron assistant.
 
 Depending on command‑line flags, this module launches the assistant either
-with a graphical user interface or as a headless process that listens for
-voice commands.  The assistant controller coordinates voice recognition,
+with the web interface or as a headless process that listens for voice
+commands.  The assistant controller coordinates voice recognition,
 command routing, LLM integration, TTS output and Discord connectivity.
 """
 from __future__ import annotations
 
 import argparse
 import logging
+import signal
 import sys
-import time
+import threading
 
 from .assistant_controller import AssistantController
 
-# GUIApp (Tkinter) is no longer used in this version.  The assistant now
-# defaults to a web‑based interface served by Flask.
-GUIApp = None  # type: ignore
+logger = logging.getLogger(__name__)
 
+# Set by the SIGINT/SIGTERM handler to end headless mode
+stop_event = threading.Event()
 
-logger = logging.getLogger(__name__)
+
+def _request_stop(signum: int, _frame: object) -> None:
+    """Signal handler: wake the main thread so it can shut down."""
+    logger.info("%s received, shutting down…", signal.Signals(signum).name)
+    stop_event.set()
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -37,15 +42,16 @@ def main(argv: list[str] | None = None) -> None:
         # Headless mode: just start voice recognition and wait
         controller = AssistantController()
         controller.start_voice_recognition()
+        signal.signal(signal.SIGINT, _request_stop)
+        signal.signal(signal.SIGTERM, _request_stop)
         logger.info("Running headless. Press Ctrl+C to exit.")
         try:
-            while True:
-                time.sleep(0.1)
-        except KeyboardInterrupt:
-            logger.info("KeyboardInterrupt received, shutting down…")
+            # Block without polling until a signal handler sets the event
+            stop_event.wait()
         finally:
             controller.stop_voice_recognition()
             controller.stop_discord()
+            controller.close()
             logger.info("Assistant shutdown.")
     else:
         # Default: start the web interface
@@ -8,39 +8,60 @@ configure the voice, set the environment variable ``TTS_AUDIO_PROMPT_PATH``
 to the path of a WAV file containing a few seconds of your desired
 voice.  The device used for generation can be selected via
 ``TTS_DEVICE`` (``cuda``, ``mps``, ``cpu`` or ``auto`` to detect the
-best available).
+best available).  ``TTS_DTYPE`` (``fp32``, ``fp16`` or ``bf16``) runs
+generation under ``torch.autocast`` at reduced precision; generation always
+runs in ``torch.inference_mode``.
 
-The ``TTSPlayer`` class loads the Chatterbox model on first use and
-serialises generation/playback using a thread lock.  Generated audio
-is streamed to the system audio output via ``sounddevice``.  If
-Chatterbox or its dependencies are not installed, the player logs
-errors and disables speech.
+The ``TTSPlayer`` class loads the Chatterbox model on construction; loaded
+models are cached per device, so re‑creating a player reuses the weights.
+The speaker conditioning for ``TTS_AUDIO_PROMPT_PATH`` is computed once per
+player rather than on every utterance.
+``speak`` only queues text: a synthesis thread generates audio sentence by
+sentence and a playback thread writes each waveform to one ``sounddevice``
+output stream that stays open for the player's lifetime, so playback of one
+sentence overlaps generation of the next.  If
+Chatterbox or its dependencies are not installed, the player logs errors
+and disables speech.
+
+torch, Chatterbox and sounddevice are imported when the first player is
+constructed rather than when this module is imported.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
 from ..utils.logging_system import setup_log_system
+from ..utils.text import SENTENCE_END
 import os
+import queue
 import threading
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 import numpy as np
 
-# Importing heavy dependencies lazily to avoid slowing down module import.
-try:
-    import torch  # type: ignore[import]
-    import torchaudio  # type: ignore[import]
-    from chatterbox.tts import ChatterboxTTS  # type: ignore[import]
-    import sounddevice as sd  # type: ignore[import]
-except Exception as _exc:
-    # Failure will be handled in TTSPlayer initialisation
-    torch = None  # type: ignore[assignment]
-    torchaudio = None  # type: ignore[assignment]
-    ChatterboxTTS = None  # type: ignore[assignment]
-    sd = None  # type: ignore[assignment]
-    _import_error = _exc
-else:
-    _import_error = None  # type: ignore[assignment]
+# Heavy dependencies, filled in by _import_backend() on first use
+torch = None  # type: ignore[assignment]
+ChatterboxTTS = None  # type: ignore[assignment]
+sd = None  # type: ignore[assignment]
+_import_lock = threading.Lock()
+
+
+def _import_backend() -> Optional[Exception]:
+    """Import torch, Chatterbox and sounddevice once; return the import error, if any."""
+    global torch, ChatterboxTTS, sd
+    with _import_lock:
+        if sd is not None:
+            return None
+        try:
+            import torch as _torch  # type: ignore[import]
+            from chatterbox.tts import ChatterboxTTS as _ChatterboxTTS  # type: ignore[import]
+            import sounddevice as _sd  # type: ignore[import]
+        except Exception as exc:
+            # Failure is handled in TTSPlayer initialisation
+            return exc
+        torch, ChatterboxTTS, sd = _torch, _ChatterboxTTS, _sd
+        return None
 
 # Use the custom logging setup so that TTS messages have their own handler and
 # propagate correctly to the web interface.  This ensures informational
@@ -48,6 +69,45 @@ else:
 # the root logger.
 logger = setup_log_system("tts_engine")
 
+# Upper bound close() waits for each worker thread, in seconds
+_CLOSE_TIMEOUT = 2.0
+
+
+def _drain(q: "queue.Queue[Any]") -> None:
+    """Discard everything currently waiting in ``q``."""
+    while True:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            return
+
+
+# TTS_DTYPE values mapped to torch dtype names (None = full precision)
+_AUTOCAST_DTYPES = {"fp32": None, "fp16": "float16", "bf16": "bfloat16"}
+
+# Serialises model loading so concurrent players wait instead of double‑loading
+_model_lock = threading.Lock()
+# Conditioning lives on the (shared) model object, so generation and
+# conditioning updates must not interleave between players
+_generate_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model_cached(device: str) -> Tuple["ChatterboxTTS", Any]:
+    model = ChatterboxTTS.from_pretrained(device=device)
+    return model, getattr(model, "conds", None)
+
+
+def _load_model(device: str) -> Tuple["ChatterboxTTS", Any]:
+    """Return ``(model, default_conditionals)`` for ``device``, loading on first use.
+
+    The weights are shared by every player on the same device.  TTS_DTYPE
+    only selects the autocast precision and does not change the weights, so
+    it is not part of the cache key.
+    """
+    with _model_lock:
+        return _load_model_cached(device)
+
 
 class TTSPlayer:
     """
@@ -63,7 +123,13 @@ class TTSPlayer:
     """
 
     def __init__(self, voice_name: Optional[str] = None) -> None:
+        self.device = "cpu"
+        self._autocast_dtype = None
+        # Speaker conditioning used for this player's utterances
+        self._conds: Any = None
+        self._per_call_prompt: Optional[str] = None
         # Determine whether dependencies loaded correctly
+        _import_error = _import_backend()
         if _import_error is not None:
             logger.error(
                 "Chatterbox TTS dependencies are missing: %s", _import_error
@@ -83,53 +149,178 @@ class TTSPlayer:
             else:
                 device = device_env
             try:
-                # Load the TTS model
-                self.model = ChatterboxTTS.from_pretrained(device=device)
-                logger.info(f"Chatterbox TTS model loaded on {device}.")
+                # Load the TTS model (or reuse an already loaded one)
+                self.model, self._conds = _load_model(device)
+                self.device = device
+                logger.info("Chatterbox TTS model loaded on %s.", device)
             except Exception as e:
-                logger.error(f"Failed to load Chatterbox TTS model: {e}", exc_info=True)
+                logger.error("Failed to load Chatterbox TTS model: %s", e, exc_info=True)
                 self.model = None
             # Retrieve custom audio prompt if provided
             audio_prompt_path = os.getenv("TTS_AUDIO_PROMPT_PATH")
             if audio_prompt_path and os.path.isfile(audio_prompt_path):
                 self.audio_prompt_path: Optional[str] = audio_prompt_path
-                logger.info(f"Using custom TTS audio prompt: {audio_prompt_path}")
+                logger.info("Using custom TTS audio prompt: %s", audio_prompt_path)
             else:
                 self.audio_prompt_path = None
-        # Thread lock to serialise generation/playback
-        self._lock = threading.Lock()
+            if self.model is not None and self.audio_prompt_path:
+                self._prepare_conditionals(self.audio_prompt_path)
+            dtype_env = os.getenv("TTS_DTYPE", "fp32").lower()
+            if dtype_env not in _AUTOCAST_DTYPES:
+                logger.warning("Unknown TTS_DTYPE %r; using fp32.", dtype_env)
+                dtype_env = "fp32"
+            dtype_name = _AUTOCAST_DTYPES[dtype_env]
+            if dtype_name is not None:
+                self._autocast_dtype = getattr(torch, dtype_name)
+                logger.info("TTS generation uses %s autocast.", dtype_env)
+        # Text waiting for synthesis and generated waveforms waiting for
+        # playback (None stops the respective worker)
+        self._text_q: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._audio_q: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+        self._stream = None
+        self._closing = False  # set by close(); workers drop remaining work
+        self._worker: Optional[threading.Thread] = None
+        self._player: Optional[threading.Thread] = None
+        if self.model is not None:
+            try:
+                # One output stream for the player's lifetime instead of a
+                # new PortAudio stream (and an audible click) per utterance
+                self._stream = sd.OutputStream(samplerate=int(self.model.sr), channels=1, dtype="float32")
+                self._stream.start()
+            except Exception as e:
+                logger.error("Failed to open TTS output stream: %s", e, exc_info=True)
+                self.model = None
+        if self.model is not None:
+            self._worker = threading.Thread(target=self._synth_loop, name="TTSSynth", daemon=True)
+            self._player = threading.Thread(target=self._play_loop, name="TTSPlayback", daemon=True)
+            self._worker.start()
+            self._player.start()
 
     def speak(self, text: str) -> None:
-        """Generate speech from text and play it through the default audio output.
+        """Queue ``text`` for speech and return immediately.
 
-        If the TTS model is unavailable or ``text`` is empty, this method
-        returns immediately.  Any exceptions during generation or playback
-        are logged and do not propagate.
+        If the TTS model is unavailable or ``text`` is empty, the text is
+        dropped.  Any exceptions during generation or playback are logged
+        on the worker threads and do not propagate.
         """
         if not text:
             return
         if self.model is None:
             logger.debug("TTS model not available; skipping speech.")
             return
-        with self._lock:
+        self._text_q.put(text)
+
+    def close(self) -> None:
+        """Stop the worker threads and close the output stream.
+
+        Pending speech is discarded.  The stream is aborted first so a
+        blocking ``write()`` returns, and it is only closed once the playback
+        thread has exited (PortAudio calls must not overlap on one stream).
+        Waiting is bounded by ``_CLOSE_TIMEOUT`` per thread: a synthesis still
+        running in ``generate()`` is left to finish on its daemon thread, and
+        its output is dropped.
+        """
+        self._closing = True
+        _drain(self._text_q)
+        self._text_q.put(None)
+        _drain(self._audio_q)
+        self._audio_q.put(None)
+        if self._stream is not None:
             try:
-                # Generate speech; returns a torch tensor with shape [channels, samples]
-                wav = self.model.generate(
-                    text, audio_prompt_path=self.audio_prompt_path  # type: ignore[arg-type]
-                )
-                # Convert to numpy on CPU
-                if hasattr(wav, "cpu"):
-                    wav_np = wav.cpu().numpy()
-                else:
-                    wav_np = np.array(wav, dtype=np.float32)
-                # Flatten to mono if multiple channels
-                if wav_np.ndim > 1:
-                    wav_np = wav_np[0]
-                # Ensure float32
-                audio = wav_np.astype(np.float32)
-                # Play the audio synchronously
-                sd.stop()
-                sd.play(audio, self.model.sr)  # type: ignore[assignment]
-                sd.wait()
+                self._stream.abort()
+            except Exception as e:
+                logger.debug("Error aborting TTS output stream: %s", e)
+        for thread in (self._worker, self._player):
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(_CLOSE_TIMEOUT)
+                if thread.is_alive():
+                    logger.warning("%s thread still busy after %.1fs; not waiting for it.", thread.name, _CLOSE_TIMEOUT)
+        player_alive = self._player is not None and self._player.is_alive()
+        self._worker = self._player = None
+        if player_alive:
+            # Closing under a write() still in progress is not allowed; the
+            # daemon thread exits on its own once write() returns.
+            self._stream = None
+        elif self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as e:
+                logger.debug("Error closing TTS output stream: %s", e)
+            self._stream = None
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+    def _synth_loop(self) -> None:
+        """Generate audio for queued text, one sentence at a time."""
+        while True:
+            text = self._text_q.get()
+            if text is None:
+                return
+            # One sentence at a time so playback can start early
+            for sentence in SENTENCE_END.split(text):
+                sentence = sentence.strip()
+                if self._closing:
+                    return
+                if not sentence:
+                    continue
+                try:
+                    audio = self._generate(sentence)
+                    if self._closing:
+                        return
+                    self._audio_q.put(audio)
+                except Exception as e:
+                    logger.error("Error during TTS generation: %s", e, exc_info=True)
+
+    def _prepare_conditionals(self, audio_prompt_path: str) -> None:
+        """Encode the reference voice once and keep the result for this player."""
+        if not hasattr(self.model, "prepare_conditionals"):
+            # Older Chatterbox: let generate() handle the prompt on every call
+            self._per_call_prompt = audio_prompt_path
+            return
+        try:
+            with _generate_lock, torch.inference_mode():
+                self.model.prepare_conditionals(audio_prompt_path)
+                self._conds = self.model.conds
+        except Exception as e:
+            logger.error("Failed to prepare TTS audio prompt: %s", e, exc_info=True)
+
+    def _generate(self, text: str) -> np.ndarray:
+        """Synthesise ``text`` into a mono float32 waveform."""
+        # Generate speech; returns a torch tensor with shape [channels, samples]
+        if self._autocast_dtype is not None:
+            precision = torch.autocast(device_type=self.device.split(":")[0], dtype=self._autocast_dtype)
+        else:
+            precision = contextlib.nullcontext()
+        with _generate_lock, torch.inference_mode(), precision:
+            if self._conds is not None:
+                self.model.conds = self._conds
+            wav = self.model.generate(
+                text, audio_prompt_path=self._per_call_prompt  # type: ignore[arg-type]
+            )
+        # Chatterbox hands back a CPU tensor, so numpy() shares its memory;
+        # force=True only copies if the tensor lives on a device or needs grad
+        if isinstance(wav, torch.Tensor):
+            wav_np = wav.numpy(force=True)
+        else:
+            wav_np = np.asarray(wav)
+        # Flatten to mono if multiple channels
+        if wav_np.ndim > 1:
+            wav_np = wav_np[0]
+        # Ensure float32 (no copy when it already is, e.g. without autocast)
+        return wav_np.astype(np.float32, copy=False)
+
+    def _play_loop(self) -> None:
+        """Write queued waveforms to the output stream back to back."""
+        while True:
+            audio = self._audio_q.get()
+            if audio is None or self._closing:
+                return
+            try:
+                # Blocks until PortAudio has buffered the data; the stream
+                # stays open between utterances, so there is no per‑call setup
+                self._stream.write(audio.reshape(-1, 1))
             except Exception as e:
-                logger.error(f"Error during TTS generation/playback: {e}", exc_info=True)
\ No newline at end of file
+                if self._closing:
+                    return  # close() aborted the stream mid‑write
+                logger.error("Error during TTS playback: %s", e, exc_info=True)
@@ -2,9 +2,13 @@
 
 The ``logging_system`` module provides a configurable logging setup that
 honours environment variables and falls back to simple coloured output when
-Rich is unavailable.
+Rich is unavailable.  ``ttl_cache`` provides a small LRU cache with expiry
+used for caching assistant replies.  ``text`` holds the ``SENTENCE_END``
+splitter shared by the controller and the TTS player.
 """
 
 from .logging_system import setup_log_system, get_logger  # noqa: F401
+from .ttl_cache import TTLCache  # noqa: F401
+from .text import SENTENCE_END  # noqa: F401
 
-__all__ = ["setup_log_system", "get_logger"]
\ No newline at end of file
+__all__ = ["setup_log_system", "get_logger", "TTLCache", "SENTENCE_END"]
\ No newline at end of file
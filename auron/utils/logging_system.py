@@ -5,10 +5,24 @@ This module configures Python's logging module with sensible defaults.  It
 supports colourised output via Rich when available and falls back to a
 minimal ANSI coloured formatter otherwise.  The log level and colour
 settings are controlled via environment variables.
+
+Console output is asynchronous: loggers only enqueue records through a
+``QueueHandler`` and a single ``QueueListener`` thread performs the actual
+formatting and terminal I/O, so logging never blocks the calling thread
+(e.g. an audio callback) on a slow terminal.  When stdout is not a terminal
+(redirected to a file or pipe) records are additionally batched in a
+``MemoryHandler`` and written out on every WARNING or after
+``LOG_BUFFER_CAPACITY`` records (default 64, ``0`` disables batching).
 """
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 
 # ANSI colour codes used only when Rich is unavailable and stdout is a TTY
 _COLOR = {
@@ -31,6 +45,109 @@ class _ColoredFormatter(logging.Formatter):
         return f"{colour}{message}{reset}"
 
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that only merges args, leaving all formatting to the listener.
+
+    The stdlib ``prepare()`` formats the record (and renders any traceback)
+    on the logging thread; this one keeps ``exc_info`` so the listener's
+    handler (e.g. Rich) renders it instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args into the message now (they may be mutated later by the
+        # caller) but leave formatting of time/level/traceback to the listener.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_lock = threading.Lock()
+_queue_handler: logging.Handler | None = None
+_listener: logging.handlers.QueueListener | None = None
+
+# Loggers already configured by setup_log_system, keyed by name
+_CONFIGURED: dict[str, logging.Logger] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _console_mode() -> tuple[bool, bool, type | None]:
+    """Return ``(tty, colour, RichHandler or None)``, probing env, TTY and Rich only once."""
+    tty = sys.stdout.isatty()
+    colour = tty and os.getenv("NO_COLOR") is None
+    if not colour:
+        return tty, False, None
+    try:
+        from rich.logging import RichHandler  # type: ignore
+    except Exception:
+        return tty, True, None
+    return tty, True, RichHandler
+
+
+def _get_queue_handler() -> logging.Handler:
+    """Return the shared QueueHandler, starting the console listener on first use.
+
+    The handler and listener are module singletons, so repeated
+    ``setup_log_system`` calls never start a second listener thread.
+    """
+    global _queue_handler, _listener
+    with _queue_lock:
+        if _queue_handler is None:
+            # SimpleQueue: lock‑free put from the C side, no task tracking
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            _listener = logging.handlers.QueueListener(
+                log_queue, _build_console_handler(), respect_handler_level=True
+            )
+            _listener.start()
+            # Drain pending records on interpreter exit
+            atexit.register(_listener.stop)
+            _queue_handler = DeferredQueueHandler(log_queue)
+        return _queue_handler
+
+
+def _build_console_handler() -> logging.Handler:
+    """Build the terminal handler (Rich, ANSI colours or plain) used by the listener."""
+    tty, colour, rich_handler = _console_mode()
+
+    handler: logging.Handler
+    if colour and rich_handler is not None:
+        handler = rich_handler(
+            rich_tracebacks=True,
+            show_time=True,
+            show_level=True,
+            show_path=False,
+            markup=False,
+        )
+        # RichHandler does its own formatting of time/level
+        formatter = logging.Formatter("%(message)s")
+        handler.setFormatter(formatter)
+    elif colour:
+        # Fallback to plain StreamHandler with ANSI colours
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = _ColoredFormatter(
+            "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
+        )
+        handler.setFormatter(formatter)
+    else:
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(
+            "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
+        )
+        handler.setFormatter(formatter)
+    # Nobody watches a redirected stream live, so batch writes; an
+    # interactive terminal (with or without NO_COLOR) gets every line immediately.
+    capacity = int(os.getenv("LOG_BUFFER_CAPACITY", "64") or 0)
+    if not tty and capacity > 0:
+        buffered = logging.handlers.MemoryHandler(
+            capacity, flushLevel=logging.WARNING, target=handler, flushOnClose=True
+        )
+        # Registered before the listener's stop(), so it runs after it
+        # (atexit is LIFO) and flushes everything the listener delivered.
+        atexit.register(buffered.close)
+        return buffered
+    return handler
+
+
 def setup_log_system(name: str, *, level: str | None = None) -> logging.Logger:
     """
     Create (or return) a configured logger.
@@ -38,54 +155,28 @@ def setup_log_system(name: str, *, level: str | None = None) -> logging.Logger:
     - Honours LOG_LEVEL env var (default INFO) unless a ``level`` is explicitly passed.
     - Uses RichHandler when available and stdout is a TTY (and NO_COLOR is not set).
     - Avoids duplicate handlers if called multiple times for the same logger.
+    - Hands records to a background listener thread for console output.
+    - Returns already configured loggers immediately unless ``level`` is given.
     """
+    cached = _CONFIGURED.get(name)
+    if cached is not None and level is None:
+        return cached
     level_str = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
     log_level = getattr(logging, level_str, logging.INFO)
 
     logger = logging.getLogger(name)
     if logger.handlers:
         logger.setLevel(log_level)
+        _CONFIGURED[name] = logger
         return logger
 
-    no_colour = os.getenv("NO_COLOR") is not None
-    is_tty = sys.stdout.isatty()
-
-    handler: logging.Handler
-    if not no_colour and is_tty:
-        try:
-            from rich.logging import RichHandler  # type: ignore
-
-            handler = RichHandler(
-                rich_tracebacks=True,
-                show_time=True,
-                show_level=True,
-                show_path=False,
-                markup=False,
-            )
-            # RichHandler does its own formatting of time/level
-            formatter = logging.Formatter("%(message)s")
-            handler.setFormatter(formatter)
-        except Exception:
-            # Fallback to plain StreamHandler with ANSI colours
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = _ColoredFormatter(
-                "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
-            )
-            handler.setFormatter(formatter)
-    else:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "[%(asctime)s] [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
-        )
-        handler.setFormatter(formatter)
-
-    logger.addHandler(handler)
+    logger.addHandler(_get_queue_handler())
     # Configure the logger's level from the environment or explicit argument
     logger.setLevel(log_level)
     # Propagate log records to the root logger so that global handlers (e.g. web log)
     # also receive them.  Without propagation the WebLogHandler attached to the root
     # logger would never see messages from module‑specific loggers.  Duplicate
-    # console output is avoided because only the module logger has a Stream/Rich handler.
+    # console output is avoided because only the module logger has the queue handler.
     logger.propagate = True
     # Ensure the root logger's level is not more restrictive than this logger's level.
     # If the root logger level is higher (e.g. WARNING) it would filter out INFO
@@ -94,6 +185,7 @@ def setup_log_system(name: str, *, level: str | None = None) -> logging.Logger:
     root_logger = logging.getLogger()
     if root_logger.level > log_level:
         root_logger.setLevel(log_level)
+    _CONFIGURED[name] = logger
     return logger
 
 
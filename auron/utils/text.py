@@ -0,0 +1,12 @@
+"""
+Text helpers shared by the assistant's subsystems.
+
+``SENTENCE_END`` splits text after sentence‑ending punctuation.  The TTS
+player synthesises one sentence at a time with it, and the controller uses
+it to hand streamed LLM replies to TTS sentence by sentence.
+"""
+import re
+
+#: Whitespace following ``.``, ``!``, ``?`` or ``…``; ``SENTENCE_END.split``
+#: yields the sentences (the last element may be an unfinished one)
+SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
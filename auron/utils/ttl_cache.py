@@ -0,0 +1,66 @@
+"""
+Small thread‑safe LRU cache with per‑entry expiry.
+
+Used to remember recent assistant replies so that repeated prompts can be
+answered without another round trip to the language model.  Entries are
+evicted in least‑recently‑used order once ``maxsize`` is reached and are
+treated as missing once they are older than ``ttl`` seconds.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Least‑recently‑used cache whose entries expire after ``ttl`` seconds.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of entries kept.  A value of ``0`` disables caching.
+    ttl:
+        Lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0) -> None:
+        self.maxsize = max(0, maxsize)
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for ``key`` or ``None`` if absent/expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,9 +2,21 @@
 
 This package exposes the ``VoiceKeyEngine`` and ``STTEngine`` classes which
 implement wake‑word detection and speech‑to‑text transcription respectively.
+Both are imported on first attribute access (PEP 562), so importing the
+package does not load Porcupine or Faster Whisper.  ``sttEngine`` is kept
+as a backward‑compatible alias of ``STTEngine``.
 """
 
-from .voicekey_engine import VoiceKeyEngine  # noqa: F401
-from .stt_engine import STTEngine  # noqa: F401
+__all__ = ["VoiceKeyEngine", "STTEngine", "sttEngine"]
 
-__all__ = ["VoiceKeyEngine", "STTEngine"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    if name == "VoiceKeyEngine":
+        from .voicekey_engine import VoiceKeyEngine
+
+        return VoiceKeyEngine
+    if name in ("STTEngine", "sttEngine"):
+        from .stt_engine import STTEngine
+
+        return STTEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,23 +4,91 @@ Speech‑to‑text engine using Faster Whisper and WebRTC VAD.
 This module records audio from the microphone until a period of silence is
 detected, then transcribes it using the Faster Whisper model.  It feeds
 float32 numpy audio directly to the model and avoids temporary files.
+
+Transcription can run on the engine's single worker thread
+(``transcribe_async``), and ``stream_transcriptions`` records the next
+utterance while the previous one is still being transcribed; ctranslate2
+releases the GIL during inference, so capture is not held up.
+
+Before WebRTC VAD runs, a cheap energy gate rejects frames quieter than the
+noise floor measured at the start of each recording.  The gate is compiled
+with numba when it is installed and uses NumPy otherwise.  With
+``STTConfig.offline_vad`` the callback only runs that gate (to find the end
+of speech) and VAD trims the finished recording on the calling thread.
 """
 from __future__ import annotations
 
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import warnings
 import time
-from dataclasses import dataclass
-from collections.abc import Iterable
+from dataclasses import dataclass, field
+from collections.abc import Iterable, Iterator
 
 import numpy as np
 import sounddevice as sd
 import webrtcvad
-from faster_whisper import WhisperModel
+
+try:
+    from numba import njit  # type: ignore[import]
+except Exception:
+    njit = None  # type: ignore[assignment]
 
 from ..utils.logging_system import setup_log_system
 
 logger = setup_log_system("stt_engine")
 
+# Recording status messages keyed by (input_overflow, input_underflow); one
+# lookup replaces a chain of flag tests.  Other flags fall back to "%s".
+_STATUS_MSGS = {
+    (True, False): "Recording input overflow: some audio frames were lost.",
+    (False, True): "Recording input underflow: no audio data available.",
+    (True, True): "Recording input overflow and underflow: audio frames were lost.",
+}
+
+# Absolute mean-square floor (RMS 50, about -56 dBFS) added to the offline
+# stop gate, so a digitally silent calibration window cannot make every
+# frame count as sound.
+_ENERGY_EPSILON = 50.0 ** 2
+
+# int16 full scale; int16 * this lies in [-1.0, 1.0) so no clipping is needed
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def _mean_square_np(frame: np.ndarray) -> float:
+    """Mean of the squared samples of an int16 frame (accumulated in float64)."""
+    return float(np.einsum("i,i->", frame, frame, dtype=np.float64)) / frame.size
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _mean_square(frame):  # pragma: no cover - compiled
+        s = 0.0
+        for x in frame:
+            s += float(x) * x
+        return s / frame.size
+
+else:
+    _mean_square = _mean_square_np
+
+
+def _physical_cores() -> int:
+    """Rough physical core count (logical CPUs halved for SMT), at least 1."""
+    return max(1, (os.cpu_count() or 4) // 2)
+
+
+def _cuda_available() -> bool:
+    """Return True if CTranslate2 can see a CUDA device."""
+    try:
+        import ctranslate2  # installed with faster-whisper
+
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
 
 @dataclass
 class STTConfig:
@@ -31,6 +99,19 @@ class STTConfig:
     max_record_seconds: int = 20
     min_silence_time: float = 1.2  # seconds of continuous silence to stop
     pre_speech_padding_ms: int = 300  # keep a bit before first detected speech
+    energy_gate: bool = True  # skip VAD for frames below the measured noise floor
+    noise_calibration_ms: int = 500  # start of each recording used to measure it
+    noise_floor_factor: float = 1.5  # RMS multiple of the noise floor that may be speech
+    # CTranslate2 threading: intra-op threads per decode (one per physical core
+    # avoids hyperthread contention) and one worker for single-utterance use
+    cpu_threads: int = field(default_factory=_physical_cores)
+    num_workers: int = 1
+    # Linux only, CPU device: pin the process to the first cpu_threads CPUs.
+    # Off by default since it restricts every thread of the process.
+    pin_cpu_affinity: bool = False
+    # record_and_transcribe: capture with only the energy gate in the audio
+    # callback and run WebRTC VAD over the finished recording instead
+    offline_vad: bool = False
 
 
 class STTEngine:
@@ -40,8 +121,28 @@ class STTEngine:
 
     - Uses WebRTC VAD to determine end‑of‑speech.
     - Feeds float32 numpy audio directly to Faster Whisper (no temp WAV files).
+    - UserWarnings from loading the model are silenced only for the duration
+      of the load, leaving the process-wide warning filters untouched.
     """
 
+    # device -> compute types CTranslate2 reports as supported, probed once per process
+    _supported_compute_types: dict[str, frozenset[str]] = {}
+
+    @classmethod
+    def _compute_types_for(cls, device: str) -> frozenset[str]:
+        """Return CTranslate2's supported compute types for ``device`` (empty if unknown)."""
+        cached = cls._supported_compute_types.get(device)
+        if cached is None:
+            try:
+                import ctranslate2  # installed with faster-whisper
+
+                cached = frozenset(ctranslate2.get_supported_compute_types(device))
+            except Exception as e:
+                logger.debug("Could not query supported compute types for %s: %s", device, e)
+                cached = frozenset()
+            cls._supported_compute_types[device] = cached
+        return cached
+
     def __init__(
         self,
         model_size: str = "small",
@@ -49,92 +150,211 @@ class STTEngine:
         compute_type: str | None = None,  # None => smart fallback
         cfg: STTConfig | None = None,
     ) -> None:
-        # Suppress noisy warnings from dependencies
-        warnings.filterwarnings("ignore", category=UserWarning)
         self.cfg = cfg or STTConfig()
         self._frame_samples = int(self.cfg.sample_rate * self.cfg.frame_ms / 1000)
         self._pre_pad_frames = max(1, int(self.cfg.pre_speech_padding_ms / self.cfg.frame_ms))
+        # Compile (or load from numba's cache) the energy gate here rather than
+        # on the audio thread during the first recording, which would overflow
+        # the input.  Multichannel capture passes a strided column view, a
+        # separate specialization, so that one is warmed up as well.
+        _mean_square(np.zeros(self._frame_samples, dtype=np.int16))
+        if self.cfg.channels > 1:
+            _mean_square(np.zeros((self._frame_samples, self.cfg.channels), dtype=np.int16)[:, 0])
+        # Cached so per-frame/per-call debug output costs one attribute check;
+        # refreshed at the start of each recording in case LOG_LEVEL changed.
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        # Reused float32 buffer for the model input (sized for the longest
+        # recording); the lock covers its use until the segments are consumed.
+        self._f32_buf = np.empty(self.cfg.sample_rate * self.cfg.max_record_seconds, dtype=np.float32)
+        self._f32_lock = threading.Lock()
+        # One contiguous capture buffer reused by every recording.  Its head
+        # doubles as the pre‑speech ring; room for two ring lengths lets the
+        # ring be unrolled in place when speech starts (see record_until_silence).
+        self._pad_len = self._pre_pad_frames * self._frame_samples
+        self._rec_buf = np.empty(self._f32_buf.size + 2 * self._pad_len, dtype=np.int16)
+        # webrtcvad builds that accept the array's buffer directly save a
+        # bytes copy per frame; probed on the first recording.
+        self._vad_accepts_buffer: bool | None = None
+        # Transcriptions run on one persistent thread, so the Whisper decoder
+        # and its thread-local buffers stay warm between calls.
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
 
-        # Smart compute_type fallback to avoid CPU float16 errors when 'auto' picks CPU
+        # Smart compute_type fallback to avoid CPU float16 errors when 'auto' picks CPU.
+        # Defaults favour CTranslate2's dynamic int8 quantization: int8 weights
+        # with activations quantized on the fly, which keeps WER close to fp32.
+        if device == "auto":
+            device = "cuda" if _cuda_available() else "cpu"
         if compute_type is not None:
             preferred: Iterable[str] = (compute_type,)
         elif device == "cpu":
             preferred = ("int8", "int16", "float32")
         else:
-            preferred = ("float16", "int8", "int16", "float32")
+            preferred = ("int8_float16", "float16", "int8", "int16", "float32")
+        if compute_type is None:
+            # Skip types the device cannot run (e.g. int8_float16 without INT8
+            # tensor cores) instead of paying a failed model load for each.
+            supported = self._compute_types_for(device)
+            usable = [ct for ct in preferred if ct in supported]
+            if usable:
+                preferred = usable
+
+        # Imported here: faster_whisper loads the ctranslate2 native libraries
+        # (and probes CUDA) on import, which only an actual engine needs.
+        from faster_whisper import WhisperModel
 
         last_err: Exception | None = None
         for ct in preferred:
             try:
-                self.model = WhisperModel(model_size, device=device, compute_type=ct)
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)
+                    self.model = WhisperModel(
+                        model_size,
+                        device=device,
+                        compute_type=ct,
+                        cpu_threads=self.cfg.cpu_threads,
+                        num_workers=self.cfg.num_workers,
+                    )
                 logger.debug(
-                    f"Loaded Whisper model='{model_size}' (device={device}, compute_type={ct})."
+                    "Loaded Whisper model='%s' (device=%s, compute_type=%s).", model_size, device, ct
                 )
                 break
             except Exception as e:  # try next compute type
                 last_err = e
-                logger.warning(f"Failed loading compute_type={ct}, trying next… ({e})")
+                logger.warning("Failed loading compute_type=%s, trying next… (%s)", ct, e)
         else:
             logger.error("Could not initialize Whisper model with any compute_type.")
             if last_err:
                 raise last_err
             raise RuntimeError("Whisper model initialization failed with unknown error.")
 
+        if device == "cpu" and self.cfg.pin_cpu_affinity and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, set(range(self.cfg.cpu_threads)))
+                logger.debug("Pinned process to CPUs 0..%d.", self.cfg.cpu_threads - 1)
+            except OSError as e:
+                logger.warning("Could not set CPU affinity: %s", e)
+
     # ------------------- Recording -------------------
-    def _vad_is_speech(self, frame_int16: np.ndarray, vad: webrtcvad.Vad) -> bool:
-        """Return True if the frame contains speech. Expects 1‑D int16 mono samples of length ``_frame_samples``."""
-        assert frame_int16.ndim == 1 and frame_int16.dtype == np.int16
-        return vad.is_speech(frame_int16.tobytes(), self.cfg.sample_rate)
+    def _vad_zero_copy(self, vad: webrtcvad.Vad) -> bool:
+        """Return True if ``vad.is_speech`` accepts a frame's memory without a bytes copy.
+
+        webrtcvad takes the frame length from ``len(buf) / 2``, so frames are
+        passed as byte‑cast memoryviews (``len`` in bytes), never as int16 arrays.
+        """
+        if self._vad_accepts_buffer is None:
+            try:
+                probe = memoryview(np.zeros(self._frame_samples, dtype=np.int16)).cast("B")
+                vad.is_speech(probe, self.cfg.sample_rate)
+                self._vad_accepts_buffer = True
+            except Exception as e:
+                # Any failure here (the C layer raises _webrtcvad.Error, which
+                # webrtcvad does not re-export) just means: use bytes copies.
+                logger.debug("webrtcvad rejected a buffer frame (%s); copying frames for VAD.", e)
+                self._vad_accepts_buffer = False
+        return self._vad_accepts_buffer
 
     def record_until_silence(self) -> np.ndarray:
         """
         Record from the default microphone until VAD registers ``min_silence_time`` after any speech.
 
-        Returns a 1‑D int16 numpy array (mono, ``cfg.sample_rate``).
+        Returns a 1‑D int16 numpy array (mono, ``cfg.sample_rate``).  The
+        array is a view into a buffer reused by the next recording; copy it
+        if it must outlive that.
         """
         vad = webrtcvad.Vad(self.cfg.vad_aggressiveness)
         frame_len = self._frame_samples
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        # Ring buffer to keep some audio before first speech (for non‑clipped start)
-        pad_buffer: list[np.ndarray] = []
-        audio_frames: list[np.ndarray] = []
+        # Preallocated storage: the callback only copies frames into rec.
+        # Until speech starts, rec's first pad_len samples are used as a ring
+        # holding some audio before first speech (for non‑clipped start).
+        rec = self._rec_buf
+        pad_len = self._pad_len
+        pad_frames = self._pre_pad_frames
+        pad_ring = rec[:pad_len].reshape(pad_frames, frame_len)
+        pad_count = 0
+        start_idx = 0
+        write_idx = 0
         have_detected_speech = False
         silence_started_at: float | None = None
-        start_time = time.time()
+        min_silence = self.cfg.min_silence_time
+        # Set by the callback once enough silence followed speech
+        done = threading.Event()
+        deadline = time.monotonic() + self.cfg.max_record_seconds
+        # Energy gate: the quietest frame of the calibration window is taken
+        # as the noise floor (a minimum stays valid if the user starts talking
+        # straight away); later frames below factor * floor skip VAD.
+        gate = self.cfg.energy_gate
+        calib_frames = max(1, self.cfg.noise_calibration_ms // self.cfg.frame_ms)
+        floor_factor_sq = self.cfg.noise_floor_factor ** 2
+        seen_frames = 0
+        min_energy = float("inf")
+        gate_energy = -1.0
+        # Hoisted out of the per-frame callback: bound methods and constants
+        vad_is_speech = vad.is_speech
+        sr = self.cfg.sample_rate
+        # Only a single-channel frame is contiguous enough to cast in place
+        zero_copy = self._vad_zero_copy(vad) and self.cfg.channels == 1
+        mean_square = _mean_square
 
         def on_audio(indata, frames, time_info, status) -> None:
-            nonlocal have_detected_speech, silence_started_at
+            nonlocal have_detected_speech, silence_started_at, pad_count, start_idx, write_idx
+            nonlocal seen_frames, min_energy, gate_energy
             if status:
-                if status.input_overflow:
-                    logger.warning("Recording input overflow: some audio frames were lost.")
-                if status.input_underflow:
-                    logger.warning("Recording input underflow: no audio data available.")
-                if not (status.input_overflow or status.input_underflow):
-                    logger.warning(f"Recording input status flag: {status}")
+                msg = _STATUS_MSGS.get((status.input_overflow, status.input_underflow))
+                if msg:
+                    logger.warning(msg)
+                else:
+                    logger.warning("Recording input status flag: %s", status)
 
-            # indata shape: (frames, channels) with dtype=int16
-            mono = indata[:, 0].copy()  # channels=1 in our stream config
+            # indata shape: (frames, channels) with dtype=int16.  With one
+            # channel reshape gives a contiguous view of the same memory, which
+            # both VAD and the copies below read without an extra copy.
+            mono = indata.reshape(-1) if indata.shape[1] == 1 else indata[:, 0]
 
-            # Keep a small pre‑speech buffer
+            if gate:
+                energy = mean_square(mono)
+                if seen_frames < calib_frames:
+                    seen_frames += 1
+                    if energy < min_energy:
+                        min_energy = energy
+                    if seen_frames == calib_frames:
+                        gate_energy = floor_factor_sq * min_energy
+                if energy < gate_energy:
+                    is_speech = False
+                else:
+                    # Zero-copy: hand VAD the frame's memory (sounddevice's buffer)
+                    is_speech = vad_is_speech(memoryview(mono).cast("B") if zero_copy else mono.tobytes(), sr)
+            else:
+                is_speech = vad_is_speech(memoryview(mono).cast("B") if zero_copy else mono.tobytes(), sr)
             if not have_detected_speech:
-                pad_buffer.append(mono)
-                if len(pad_buffer) > self._pre_pad_frames:
-                    pad_buffer.pop(0)
-
-            is_speech = self._vad_is_speech(mono, vad)
-            if is_speech:
-                if not have_detected_speech:
-                    # flush pre‑speech padding into main buffer
-                    audio_frames.extend(pad_buffer)
-                    pad_buffer.clear()
+                if not is_speech:
+                    # Keep a small pre‑speech buffer
+                    np.copyto(pad_ring[pad_count % pad_frames], mono)
+                    pad_count += 1
+                    return
+                # Make the padding contiguous and oldest first: ring slots
+                # [s:] already are; copy slots [:s] right behind the ring.
                 have_detected_speech = True
+                if pad_count <= pad_frames:
+                    write_idx = pad_count * frame_len
+                else:
+                    wrap = (pad_count % pad_frames) * frame_len
+                    rec[pad_len:pad_len + wrap] = rec[:wrap]
+                    start_idx = wrap
+                    write_idx = pad_len + wrap
+            if is_speech:
                 silence_started_at = None
-                audio_frames.append(mono)
             else:
-                if have_detected_speech:
-                    audio_frames.append(mono)
-                    if silence_started_at is None:
-                        silence_started_at = time.time()
+                now = time.monotonic()
+                if silence_started_at is None:
+                    silence_started_at = now
+                elif now - silence_started_at >= min_silence:
+                    done.set()
+            end = write_idx + frames
+            if end <= rec.size:
+                rec[write_idx:end] = mono
+                write_idx = end
 
         with sd.InputStream(
             samplerate=self.cfg.sample_rate,
@@ -144,25 +364,127 @@ class STTEngine:
             callback=on_audio,
         ):
             logger.info("Voice recording started (waiting for silence or timeout)…")
-            while True:
-                now = time.time()
-                if now - start_time > self.cfg.max_record_seconds:
-                    logger.info("Maximum recording duration reached, stopping.")
-                    break
-                if have_detected_speech and silence_started_at is not None:
-                    if now - silence_started_at >= self.cfg.min_silence_time:
-                        logger.debug("Silence detected, stopping recording.")
-                        break
-                time.sleep(0.02)
-
-        if not audio_frames:
+            # Sleeps until the callback reports end of speech or time runs out
+            if done.wait(max(0.0, deadline - time.monotonic())):
+                logger.debug("Silence detected, stopping recording.")
+            else:
+                logger.info("Maximum recording duration reached, stopping.")
+
+        if write_idx == start_idx:
             logger.debug("No audio captured.")
             return np.array([], dtype=np.int16)
 
-        audio = np.concatenate(audio_frames, axis=0).astype(np.int16)
-        logger.debug(
-            f"Captured {len(audio)} samples (~{len(audio)/self.cfg.sample_rate:.2f}s)."
-        )
+        audio = rec[start_idx:write_idx]
+        if self._debug_enabled:
+            logger.debug(
+                "Captured %d samples (~%.2fs).", len(audio), len(audio) / self.cfg.sample_rate
+            )
+        return audio
+
+    def _capture_raw(self, max_seconds: float) -> np.ndarray:
+        """
+        Record until the energy gate sees ``min_silence_time`` of quiet after sound.
+
+        The callback only copies frames and computes their energy; no VAD or
+        logging runs on the audio thread.  Returns a view into the reused
+        capture buffer, like :meth:`record_until_silence`.
+        """
+        frame_len = self._frame_samples
+        rec = self._rec_buf
+        limit = min(rec.size, int(max_seconds * self.cfg.sample_rate))
+        write_idx = 0
+        calib_frames = max(1, self.cfg.noise_calibration_ms // self.cfg.frame_ms)
+        floor_factor_sq = self.cfg.noise_floor_factor ** 2
+        seen_frames = 0
+        calib_energy = 0.0
+        gate_energy = float("inf")  # nothing counts as sound until calibrated
+        heard = False
+        quiet_frames = 0
+        stop_frames = max(1, int(self.cfg.min_silence_time * 1000 / self.cfg.frame_ms))
+        overflowed = False
+        done = threading.Event()
+        mean_square = _mean_square
+
+        def on_audio(indata, frames, time_info, status) -> None:
+            nonlocal write_idx, seen_frames, calib_energy, gate_energy, heard, quiet_frames, overflowed
+            if status and status.input_overflow:
+                overflowed = True
+            mono = indata.reshape(-1) if indata.shape[1] == 1 else indata[:, 0]
+            end = write_idx + frames
+            if end > limit:
+                done.set()
+                return
+            rec[write_idx:end] = mono
+            write_idx = end
+            energy = mean_square(mono)
+            if seen_frames < calib_frames:
+                # The mean over the window is the noise floor: unlike a
+                # single quietest frame it sits above normal noise jitter.
+                seen_frames += 1
+                calib_energy += energy
+                if seen_frames == calib_frames:
+                    gate_energy = floor_factor_sq * calib_energy / calib_frames + _ENERGY_EPSILON
+            if energy > gate_energy:
+                heard = True
+                quiet_frames = 0
+            elif heard:
+                quiet_frames += 1
+                if quiet_frames >= stop_frames:
+                    done.set()
+
+        with sd.InputStream(
+            samplerate=self.cfg.sample_rate,
+            channels=self.cfg.channels,
+            dtype="int16",
+            blocksize=frame_len,
+            callback=on_audio,
+        ):
+            logger.info("Voice recording started (waiting for silence or timeout)…")
+            if not done.wait(max_seconds):
+                logger.info("Maximum recording duration reached, stopping.")
+        if overflowed:
+            logger.warning("Recording input overflow: some audio frames were lost.")
+        return rec[:write_idx]
+
+    def _trim_by_vad(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Cut ``audio`` to its VAD speech span, keeping the pre‑speech padding on both ends.
+
+        Returns an empty array if VAD finds no speech.
+        """
+        frame_len = self._frame_samples
+        n_frames = audio.size // frame_len
+        if n_frames == 0:
+            return audio[:0]
+        vad = webrtcvad.Vad(self.cfg.vad_aggressiveness)
+        vad_is_speech = vad.is_speech
+        sr = self.cfg.sample_rate
+        frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+        if self._vad_zero_copy(vad):
+            speech = [i for i in range(n_frames) if vad_is_speech(memoryview(frames[i]).cast("B"), sr)]
+        else:
+            speech = [i for i in range(n_frames) if vad_is_speech(frames[i].tobytes(), sr)]
+        if not speech:
+            logger.debug("No speech detected in recording.")
+            return audio[:0]
+        pad = self._pre_pad_frames
+        start = max(0, speech[0] - pad) * frame_len
+        end = min(n_frames, speech[-1] + 1 + pad) * frame_len
+        return audio[start:end]
+
+    def record_offline(self) -> np.ndarray:
+        """
+        Like :meth:`record_until_silence`, but with VAD run after capture.
+
+        Keeps the audio callback down to a copy and an energy check, which
+        avoids input overflows on slow machines.
+        """
+        self._debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        audio = self._trim_by_vad(self._capture_raw(self.cfg.max_record_seconds))
+        if self._debug_enabled:
+            logger.debug(
+                "Captured %d samples (~%.2fs).", len(audio), len(audio) / self.cfg.sample_rate
+            )
         return audio
 
     # ------------------- Transcription -------------------
@@ -179,8 +501,13 @@ class STTEngine:
         if audio_int16.size == 0:
             return ""
 
-        audio_f32 = (audio_int16.astype(np.float32) / 32768.0).clip(-1.0, 1.0)
+        # One fused int16 -> float32 scaling pass into the reusable buffer;
+        # larger inputs (or a concurrent call) get a freshly allocated one.
+        n = audio_int16.size
+        use_shared = n <= self._f32_buf.size and self._f32_lock.acquire(blocking=False)
         try:
+            audio_f32 = self._f32_buf[:n] if use_shared else np.empty(n, dtype=np.float32)
+            np.multiply(audio_int16.reshape(-1), _INT16_SCALE, out=audio_f32, casting="unsafe")
             segments, info = self.model.transcribe(
                 audio_f32,
                 beam_size=beam_size,
@@ -189,16 +516,53 @@ class STTEngine:
                 # vad_filter=True,
                 # vad_parameters={"min_silence_duration_ms": int(self.cfg.min_silence_time * 1000)},
             )
+            # segments is lazy and still reads audio_f32 while being consumed
             text = " ".join(seg.text.strip() for seg in segments).strip()
-            logger.debug(f"Transcription result: '{text}'")
+            if self._debug_enabled:
+                logger.debug("Transcription result: '%s'", text)
             return text
         except Exception as e:
-            logger.error(f"Error during transcription: {e}", exc_info=True)
+            logger.error("Error during transcription: %s", e, exc_info=True)
             raise
+        finally:
+            if use_shared:
+                self._f32_lock.release()
 
     def record_and_transcribe(
         self, *, language: str | None = "de", beam_size: int = 5
     ) -> str:
         """Helper to record and transcribe in one call."""
-        audio = self.record_until_silence()
-        return self.transcribe(audio, language=language, beam_size=beam_size)
\ No newline at end of file
+        audio = self.record_offline() if self.cfg.offline_vad else self.record_until_silence()
+        return self.transcribe(audio, language=language, beam_size=beam_size)
+
+    def transcribe_async(
+        self, audio_int16: np.ndarray, *, language: str | None = "de", beam_size: int = 5
+    ) -> "Future[str]":
+        """Submit :meth:`transcribe` to the engine's worker thread and return its future.
+
+        ``audio_int16`` must stay unchanged until the future completes (the
+        array returned by :meth:`record_until_silence` is reused by the next
+        recording).
+        """
+        return self._pool.submit(self.transcribe, audio_int16, language=language, beam_size=beam_size)
+
+    def stream_transcriptions(
+        self, *, language: str | None = "de", beam_size: int = 5
+    ) -> Iterator["Future[str]"]:
+        """
+        Record utterances back to back, yielding a transcription future for each.
+
+        Each recording is copied and handed to the worker thread, and the next
+        recording starts right away, so model latency overlaps microphone
+        capture.  Empty recordings are skipped.  Stops when the consumer
+        closes the generator.
+        """
+        while True:
+            audio = self.record_until_silence()
+            if audio.size == 0:
+                continue
+            yield self.transcribe_async(audio.copy(), language=language, beam_size=beam_size)
+
+    def close(self) -> None:
+        """Shut down the transcription worker thread."""
+        self._pool.shutdown(wait=False)
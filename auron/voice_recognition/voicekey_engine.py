@@ -3,17 +3,21 @@ Wake‑word detection engine using Picovoice Porcupine.
 
 This module wraps the Picovoice Porcupine library to provide always‑on wake
 word detection.  When the configured keyword is detected, a user‑supplied
-callback is invoked on a daemon thread.  A simple cooldown prevents rapid
+callback is invoked on a persistent daemon worker thread.  A simple cooldown prevents rapid
 re‑triggering while the callback is still executing.
+
+Audio is pulled with blocking reads on a dedicated reader thread, which
+also runs Porcupine; no Python callback runs on PortAudio's real‑time
+thread.
 """
 
+import logging
 import os
+import queue
 import threading
 import time
 from collections.abc import Callable, Sequence
 
-import numpy as np
-import pvporcupine
 import sounddevice as sd
 try:
     # Use python‑dotenv to load environment variables if available
@@ -28,6 +32,10 @@ from ..utils.logging_system import setup_log_system
 load_dotenv()
 logger = setup_log_system("voicekey_engine")
 
+# Consecutive read failures (e.g. device unplugged) before the reader gives
+# up; between attempts it backs off from 50 ms up to 1 s.
+_MAX_READ_FAILURES = 10
+
 
 def _resolve_device(device: int | str | None) -> int | None:
     """Resolve a sounddevice input by index or fuzzy name (case‑insensitive).
@@ -43,7 +51,7 @@ def _resolve_device(device: int | str | None) -> int | None:
             and name_lc in str(info.get("name", "")).lower()
         ):
             return idx
-    logger.warning(f"Input device '{device}' not found, using default.")
+    logger.warning("Input device '%s' not found, using default.", device)
     return None
 
 
@@ -51,9 +59,12 @@ class VoiceKeyEngine:
     """
     Always‑listening wake word detector using Picovoice Porcupine.
 
-    - Triggers ``callback`` on detection (executed on a daemon thread).
+    - Triggers ``callback`` on detection (executed on a daemon worker thread).
     - Includes a simple cooldown to avoid multi‑trigger storms while the
       callback runs.
+    - Reads the input stream and runs Porcupine on one reader thread;
+      PortAudio buffers audio between reads, so no Python callback runs on
+      its real‑time thread.
     """
 
     def __init__(
@@ -87,6 +98,10 @@ class VoiceKeyEngine:
             else [float(os.getenv("PORC_SENSITIVITY", "0.6"))] * len(kp)
         )
 
+        # Imported here so that importing this module does not load the
+        # Porcupine native library
+        import pvporcupine
+
         try:
             self.porcupine = pvporcupine.create(
                 access_key=access_key,
@@ -96,12 +111,25 @@ class VoiceKeyEngine:
             )
             logger.debug("Porcupine initialized.")
         except pvporcupine.PorcupineError as e:
-            logger.error(f"Failed to initialize Porcupine: {e}")
+            logger.error("Failed to initialize Porcupine: %s", e)
             raise
 
         self._callback = callback
         self._cooldown = max(0.0, cooldown_seconds)
         self._last_trigger: float = 0.0
+        # Checked by the reader before any overflow logging; refreshed on
+        # start() so a changed LOG_LEVEL takes effect on the next resume.
+        self._warn_enabled = logger.isEnabledFor(logging.WARNING)
+        # Wake callbacks run one after another on a single long‑lived thread;
+        # None in the queue stops it.
+        self._cb_queue: "queue.SimpleQueue[Callable[[], None] | None]" = queue.SimpleQueue()
+        self._cb_thread = threading.Thread(target=self._cb_worker, name="WakewordCallback", daemon=True)
+        self._cb_thread.start()
+
+        # Reader thread state; _running is cleared to make the reader return
+        # after its current read (at most one frame, ~32 ms).
+        self._running = False
+        self._reader: threading.Thread | None = None
 
         latency_ms = (
             input_latency_ms
@@ -112,24 +140,26 @@ class VoiceKeyEngine:
 
         sd_device = _resolve_device(device)
         try:
+            # No callback: the stream is read in blocking mode by the reader
+            # thread.  RawInputStream.read returns the filled buffer as is,
+            # without wrapping it in a NumPy array per read.
             self.stream = sd.RawInputStream(
                 samplerate=self.porcupine.sample_rate,
                 blocksize=self.porcupine.frame_length,
                 dtype="int16",
                 channels=1,
-                callback=self._on_audio,
                 device=sd_device,
                 latency=latency,
             )
             logger.debug(
                 "Audio input ready (device=%s, %d Hz, frame=%d).",
-                str(sd_device),
+                sd_device,
                 self.porcupine.sample_rate,
                 self.porcupine.frame_length,
             )
         except Exception as e:
             self.porcupine.delete()
-            logger.error(f"Failed to open audio input stream: {e}")
+            logger.error("Failed to open audio input stream: %s", e)
             raise
 
     # -------------- lifecycle --------------
@@ -142,21 +172,39 @@ class VoiceKeyEngine:
 
     def start(self) -> None:
         if self.stream and not self.stream.active:
+            self._warn_enabled = logger.isEnabledFor(logging.WARNING)
             self.stream.start()
+            self._running = True
+            self._reader = threading.Thread(
+                target=self._read_loop, name="WakewordReader", daemon=True
+            )
+            self._reader.start()
             logger.debug("VoiceKeyEngine started (listening).")
 
+    def _join_reader(self) -> None:
+        """Stop the reader thread and wait for its current read to finish."""
+        self._running = False
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join(timeout=1.0)
+        self._reader = None
+
     def pause(self) -> None:
         if self.stream and self.stream.active:
+            # The reader must be out of stream.read() before the stream stops
+            self._join_reader()
             self.stream.stop()
             logger.debug("VoiceKeyEngine paused.")
 
     def stop(self) -> None:
+        # Let the reader finish before the stream closes and Porcupine is deleted
+        self._join_reader()
         try:
             if self.stream:
                 if self.stream.active:
                     self.stream.stop()
                 self.stream.close()
         finally:
+            self._cb_queue.put(None)
             try:
                 self.porcupine.delete()
             finally:
@@ -168,33 +216,69 @@ class VoiceKeyEngine:
     def is_listening(self) -> bool:
         return bool(self.stream and self.stream.active)
 
-    # -------------- audio callback --------------
-    def _on_audio(self, indata, frames, time_info, status) -> None:
-        try:
-            if status:
-                if status.input_overflow:
+    # -------------- reader thread --------------
+    def _read_loop(self) -> None:
+        # Bound once: attribute lookups on the stream and Porcupine objects
+        # per frame add up (~31 frames per second, forever)
+        stream = self.stream
+        frame_length = self.porcupine.frame_length
+        read = stream.read
+        process = self.porcupine.process
+        trigger = self._trigger
+        failures = 0
+        while self._running:
+            try:
+                # Whole frames already buffered by PortAudio are taken in one
+                # read, so catching up after a stall costs one call, not one per
+                # frame; otherwise this blocks until a full frame is available.
+                n = max(1, stream.read_available // frame_length)
+                block, overflowed = read(n * frame_length)
+                if overflowed and self._warn_enabled:
                     logger.warning("Audio input overflow detected.")
-                if status.input_underflow:
-                    logger.warning("Audio input underflow detected.")
-                if not (status.input_overflow or status.input_underflow):
-                    logger.warning(f"Audio input status flag: {status}")
-
-            pcm = np.frombuffer(indata, dtype=np.int16)
-            result = self.porcupine.process(pcm)
-            if result >= 0:
-                now = time.time()
-                if now - self._last_trigger < self._cooldown:
-                    return  # debounce
-                self._last_trigger = now
-
-                def _run() -> None:
-                    try:
-                        self._callback()
-                    except Exception as e:
-                        logger.error(
-                            f"Exception in wakeword callback: {e}", exc_info=True
-                        )
-
-                threading.Thread(target=_run, daemon=True).start()
-        except Exception as e:
-            logger.error(f"Error in wakeword audio callback: {e}", exc_info=True)
\ No newline at end of file
+                # pvporcupine copies the frame element by element into a
+                # ctypes array; an int16 memoryview yields plain ints for it.
+                # channels=1, so the raw buffer is the samples back to back.
+                samples = memoryview(block).cast("h")
+            except Exception as e:
+                if not self._running:
+                    return  # stream stopped underneath a read during shutdown
+                failures += 1
+                if failures >= _MAX_READ_FAILURES:
+                    logger.critical(
+                        "Wakeword audio input failed %d times in a row; stopping detection: %s",
+                        failures, e,
+                    )
+                    self._running = False
+                    return
+                # Full traceback once; a persistent error must not flood the log
+                logger.error("Error reading wakeword audio: %s", e, exc_info=failures == 1)
+                time.sleep(min(1.0, 0.05 * 2 ** (failures - 1)))
+                continue
+            failures = 0
+            for start in range(0, n * frame_length, frame_length):
+                try:
+                    result = process(samples[start:start + frame_length])
+                except Exception as e:
+                    logger.error("Error in wakeword detection: %s", e, exc_info=True)
+                    continue
+                if result >= 0:
+                    trigger()
+
+    def _trigger(self) -> None:
+        now = time.time()
+        if now - self._last_trigger < self._cooldown:
+            return  # debounce
+        self._last_trigger = now
+        self._cb_queue.put(self._callback)
+
+    def _cb_worker(self) -> None:
+        while True:
+            fn = self._cb_queue.get()
+            if fn is None:
+                return
+            try:
+                fn()
+            except Exception as e:
+                logger.error(
+                    "Exception in wakeword callback: %s", e, exc_info=True
+                )
@@ -11,11 +11,31 @@ backend.
 """
 from __future__ import annotations
 
+import copy
+import gzip
+import json
 import logging
+import os
+import queue
 import threading
-from typing import List, Dict, Any
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, Any
 
-from flask import Flask, jsonify, render_template, request, Response, make_response
+from flask import Flask, jsonify, render_template, request, Response
+
+try:
+    # Production WSGI server; the Flask development server is used without it
+    from waitress import serve as _waitress_serve  # type: ignore[import]
+except Exception:
+    _waitress_serve = None  # type: ignore[assignment]
+
+try:
+    # orjson encodes the polled payloads in C; jsonify is the fallback
+    from orjson import dumps as _orjson_dumps  # type: ignore[import]
+except Exception:
+    _orjson_dumps = None  # type: ignore[assignment]
 
 from ..assistant_controller import AssistantController
 
@@ -32,25 +52,124 @@ _flask_logging.getLogger("werkzeug").setLevel(_flask_logging.WARNING)
 controller = AssistantController()
 controller.start_voice_recognition()
 
+# Persistent workers for /api/message; bounds how many commands run at once
+# without creating a thread per request.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web-cmd")
+
 # In‑memory conversation history and log buffer.  In a real application,
 # these would likely be stored externally or in a database.
-CHAT_HISTORY: List[Dict[str, str]] = []
-LOG_BUFFER: List[str] = []
+CHAT_HISTORY_MAX = int(os.getenv("CHAT_HISTORY_MAX", "1000"))
+# Bounded like LOG_BUFFER; entries pushed out are appended to the JSONL file
+# CHAT_ARCHIVE_PATH (if set) by a background writer.
+CHAT_HISTORY: Deque[Dict[str, str]] = deque(maxlen=CHAT_HISTORY_MAX)
+CHAT_ARCHIVE_PATH = os.getenv("CHAT_ARCHIVE_PATH", "").strip()
 LOG_BUFFER_MAX = 200  # store up to 200 lines
+# Bounded deque: the oldest line is dropped on append once full
+# Holds the LogRecords themselves; they are formatted when a client asks
+# for them (see WebLogHandler.text), not for every record logged.
+LOG_BUFFER: Deque[logging.LogRecord] = deque(maxlen=LOG_BUFFER_MAX)
+# Both are written from logging/worker threads while request threads read
+# them; mutations hold the lock and readers serialize a copy taken under it.
+_chat_lock = threading.Lock()
+_log_lock = threading.Lock()
+# Bumped under the matching lock on every change; /api/chat and /api/logs use
+# them as ETags so unchanged polls get a bodiless 304.  The start time keeps
+# tags from a previous run from matching.
+_chat_version = 0
+_log_version = 0
+_ETAG_PREFIX = "%x-" % int(time.time())
+
+# /api/status payload, updated where the values change instead of being
+# rebuilt on every poll.  Subsystem flags only change through the toggle
+# endpoints below; the lengths are kept under the buffer locks.
+_status: Dict[str, Any] = {
+    "voice_enabled": False,
+    "tts_enabled": True,
+    "discord_enabled": False,
+    "chat_length": 0,
+    "log_length": 0,
+}
+
+
+_archive_q: "queue.Queue[Dict[str, str]] | None" = None
+
+
+def _archive_writer(path: str, q: "queue.Queue[Dict[str, str]]") -> None:
+    """Append archived chat entries to ``path`` as JSON lines, off the request path."""
+    while True:
+        entry = q.get()
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                # Write whatever else was evicted meanwhile with the same open
+                while True:
+                    try:
+                        entry = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logging.getLogger(__name__).error("Failed to archive chat history: %s", e)
+
+
+if CHAT_ARCHIVE_PATH:
+    _archive_q = queue.Queue()
+    threading.Thread(
+        target=_archive_writer, args=(CHAT_ARCHIVE_PATH, _archive_q), name="ChatArchive", daemon=True
+    ).start()
+
+
+def _append_chat(role: str, text: str) -> None:
+    """Add a message to CHAT_HISTORY, archiving the entry it pushes out."""
+    global _chat_version
+    with _chat_lock:
+        if _archive_q is not None and len(CHAT_HISTORY) == CHAT_HISTORY_MAX:
+            _archive_q.put(CHAT_HISTORY[0])
+        CHAT_HISTORY.append({"role": role, "text": text})
+        _chat_version += 1
+        _status["chat_length"] = len(CHAT_HISTORY)
+
+
+def _refresh_subsystems() -> None:
+    """Copy the controller's subsystem flags into ``_status``."""
+    _status["voice_enabled"] = controller.voice_enabled
+    _status["tts_enabled"] = controller.tts_enabled
+    _status["discord_enabled"] = controller.discord_bridge is not None
+
+
+_refresh_subsystems()
 
 
 class WebLogHandler(logging.Handler):
-    """Custom logging handler that appends log messages to LOG_BUFFER."""
+    """Custom logging handler that appends log records to LOG_BUFFER."""
 
     def __init__(self) -> None:
         super().__init__(level=logging.DEBUG)
 
     def emit(self, record: logging.LogRecord) -> None:
-        msg = self.format(record)
-        LOG_BUFFER.append(msg)
-        # Trim old logs
-        if len(LOG_BUFFER) > LOG_BUFFER_MAX:
-            del LOG_BUFFER[: len(LOG_BUFFER) - LOG_BUFFER_MAX]
+        global _log_version
+        # Merge args into the message now (they may be mutated later, and
+        # holding them would keep every arg object alive) but leave the
+        # Formatter step until the record is requested.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Render the traceback now and drop it so its frames can be freed
+            self.text(record)
+            record.exc_info = None
+        with _log_lock:
+            LOG_BUFFER.append(record)
+            _log_version += 1
+            _status["log_length"] = len(LOG_BUFFER)
+
+    def text(self, record: logging.LogRecord) -> str:
+        """Return ``record`` formatted for the web UI, formatting it only once."""
+        try:
+            return record._web_text  # type: ignore[attr-defined]
+        except AttributeError:
+            record._web_text = text = self.format(record)  # type: ignore[attr-defined]
+            return text
 
 
 # Attach our handler to the root logger
@@ -68,47 +187,89 @@ root_logger.addHandler(_web_log_handler)
 root_logger.setLevel(logging.INFO)
 
 
+def _json(obj: Any) -> Response:
+    """Return ``obj`` as a JSON response, encoded with orjson when available."""
+    if _orjson_dumps is None:
+        return jsonify(obj)
+    return Response(_orjson_dumps(obj), mimetype="application/json")
+
+
+def _client_has(version: int) -> bool:
+    """Return True if the request's If-None-Match names ``version``."""
+    return request.if_none_match.contains(_ETAG_PREFIX + str(version))
+
+
+def _tagged(resp: Response, version: int) -> Response:
+    """Attach the ETag for ``version``; no-cache makes browsers revalidate each poll."""
+    resp.set_etag(_ETAG_PREFIX + str(version))
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp
+
+
+# The page is static, so it is rendered and compressed once instead of per
+# request; the plain copy serves clients that do not accept gzip.
+with app.app_context():
+    _INDEX_HTML = render_template("index.html").encode("utf-8")
+_INDEX_HTML_GZ = gzip.compress(_INDEX_HTML)
+
+
 @app.route("/")
-def index() -> str:
+def index() -> Response:
     """Serve the main web page."""
-    return render_template("index.html")
+    headers = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+    if request.accept_encodings["gzip"]:
+        headers["Content-Encoding"] = "gzip"
+        return Response(_INDEX_HTML_GZ, mimetype="text/html", headers=headers)
+    return Response(_INDEX_HTML, mimetype="text/html", headers=headers)
 
 
 @app.route("/api/status", methods=["GET"])
 def api_status() -> Any:
     """Return the current state of the subsystems and lengths of history/logs."""
-    return jsonify(
-        voice_enabled=controller.voice_enabled,
-        tts_enabled=controller.tts_enabled,
-        discord_enabled=controller.discord_bridge is not None,
-        chat_length=len(CHAT_HISTORY),
-        log_length=len(LOG_BUFFER),
-    )
+    return _json(_status)
 
 
 @app.route("/api/clear_chat", methods=["POST"])
 def api_clear_chat() -> Any:
     """Clear the conversation history."""
-    CHAT_HISTORY.clear()
+    global _chat_version
+    with _chat_lock:
+        CHAT_HISTORY.clear()
+        _chat_version += 1
+        _status["chat_length"] = 0
     return jsonify(success=True)
 
 
 @app.route("/api/clear_logs", methods=["POST"])
 def api_clear_logs() -> Any:
     """Clear the log buffer."""
-    LOG_BUFFER.clear()
+    global _log_version
+    with _log_lock:
+        LOG_BUFFER.clear()
+        _log_version += 1
+        _status["log_length"] = 0
     return jsonify(success=True)
 
 
+_shutdown_lock = threading.Lock()
+_shutdown_timer: "threading.Timer | None" = None
+
+
 @app.route("/api/shutdown", methods=["POST"])
 def api_shutdown() -> Any:
     """Shut down the Flask development server."""
+    global _shutdown_timer
+    # Read while the request context exists; the shutdown runs after it ends.
+    # Only old Werkzeug dev servers provide this hook; os._exit covers the rest.
+    server_shutdown = request.environ.get('werkzeug.server.shutdown')
+
     # Immediately respond to the client before shutting down the assistant.
     def shutdown_system() -> None:
         try:
             # Stop subsystems gracefully
             controller.stop_voice_recognition()
             controller.stop_discord()
+            controller.close()
             # Fully stop the voice engine to release audio resources
             try:
                 controller.engine.stop()
@@ -116,13 +277,18 @@ def api_shutdown() -> Any:
                 pass
         finally:
             # Shut down the Flask server
-            func = request.environ.get('werkzeug.server.shutdown')
-            if func:
-                func()
+            if server_shutdown:
+                server_shutdown()
             # Exit the entire process
             import os
             os._exit(0)
-    threading.Thread(target=shutdown_system, daemon=True).start()
+    # One short timer lets the response go out first; repeated requests
+    # while it is pending do not start another shutdown.
+    with _shutdown_lock:
+        if _shutdown_timer is None:
+            _shutdown_timer = threading.Timer(0.05, shutdown_system)
+            _shutdown_timer.daemon = True
+            _shutdown_timer.start()
     return jsonify(message="Assistant shutting down…")
 
 
@@ -134,20 +300,19 @@ def api_message() -> Any:
     if not text:
         return jsonify(error="Empty message"), 400
     # Append user message to history
-    CHAT_HISTORY.append({"role": "User", "text": text})
-    # Process via assistant on a separate thread to avoid blocking the server
-    reply_holder: Dict[str, Any] = {}
-
-    def _process() -> None:
-        response = controller.handle_command(text)
-        reply_holder["response"] = response or ""
-        # Append assistant reply to history
-        CHAT_HISTORY.append({"role": "Assistant", "text": reply_holder["response"]})
-
-    thread = threading.Thread(target=_process, daemon=True)
-    thread.start()
-    thread.join()  # Wait synchronously for response to keep API simple
-    return jsonify(reply=reply_holder.get("response", ""))
+    _append_chat("User", text)
+    # Run on the shared executor and wait for the reply to keep the API simple
+    response = _executor.submit(controller.handle_command, text).result() or ""
+    # Append assistant reply to history
+    _append_chat("Assistant", response)
+    return jsonify(reply=response)
+
+
+@app.route("/api/cache/clear", methods=["POST"])
+def api_clear_cache() -> Any:
+    """Forget cached assistant replies (LLM_CACHE_SIZE=0 disables the cache)."""
+    controller.clear_reply_cache()
+    return jsonify(success=True)
 
 
 @app.route("/api/voice/toggle", methods=["POST"])
@@ -157,6 +322,7 @@ def api_toggle_voice() -> Any:
         controller.stop_voice_recognition()
     else:
         controller.start_voice_recognition()
+    _refresh_subsystems()
     return jsonify(voice_enabled=controller.voice_enabled)
 
 
@@ -164,6 +330,7 @@ def api_toggle_voice() -> Any:
 def api_toggle_tts() -> Any:
     """Toggle text‑to‑speech on/off."""
     controller.tts_enabled = not controller.tts_enabled
+    _refresh_subsystems()
     return jsonify(tts_enabled=controller.tts_enabled)
 
 # Restart the TTS engine on demand
@@ -186,38 +353,58 @@ def api_toggle_discord() -> Any:
         controller.start_discord()
     else:
         controller.stop_discord()
+    _refresh_subsystems()
     return jsonify(discord_enabled=controller.discord_bridge is not None)
 
 
 @app.route("/api/chat", methods=["GET"])
 def api_chat() -> Any:
     """Return the full conversation history."""
-    return jsonify(history=CHAT_HISTORY)
+    with _chat_lock:
+        version = _chat_version
+        snap = None if _client_has(version) else list(CHAT_HISTORY)
+    if snap is None:
+        return Response(status=304)
+    return _tagged(_json({"history": snap}), version)
 
 
 @app.route("/api/logs", methods=["GET"])
 def api_logs() -> Any:
     """Return the recent log lines."""
-    return jsonify(logs=LOG_BUFFER)
+    with _log_lock:
+        version = _log_version
+        snap = None if _client_has(version) else list(LOG_BUFFER)
+    if snap is None:
+        return Response(status=304)
+    text = _web_log_handler.text
+    return _tagged(_json({"logs": [text(rec) for rec in snap]}), version)
 
 # New endpoint: download logs as a plain text file.
 @app.route("/api/logs/download", methods=["GET"])
 def api_logs_download() -> Any:
     """Return the recent log lines as a downloadable text file."""
-    # Join log lines with newlines.  Use LF by default.
-    text = "\n".join(LOG_BUFFER)
-    # Use make_response to create a proper Flask Response object
-    resp = make_response(text)
-    resp.headers.set("Content-Type", "text/plain")
-    resp.headers.set(
-        "Content-Disposition", "attachment; filename=auron_logs.txt"
+    with _log_lock:
+        snap = list(LOG_BUFFER)
+
+    # Streamed line by line (LF separated) instead of joined into one string
+    def _lines():
+        text = _web_log_handler.text
+        for i, rec in enumerate(snap):
+            yield text(rec) if i == 0 else "\n" + text(rec)
+
+    return Response(
+        _lines(),
+        mimetype="text/plain",
+        headers={"Content-Disposition": "attachment; filename=auron_logs.txt"},
     )
-    return resp
 
 
 def run_app(host: str = "127.0.0.1", port: int = 5000, debug: bool = False, *, auto_open: bool = True) -> None:
     """
-    Run the Flask development server.  Intended to be called from main.
+    Run the web UI server.  Intended to be called from main.
+
+    Uses waitress when it is installed (and ``debug`` is off), otherwise the
+    threaded Flask development server.
 
     Parameters
     ----------
@@ -236,7 +423,10 @@ def run_app(host: str = "127.0.0.1", port: int = 5000, debug: bool = False, *, a
                 pass
         # Use a timer so the call does not block the server startup
         threading.Timer(1.0, _open).start()
-    app.run(host=host, port=port, debug=debug, use_reloader=False)
+    if _waitress_serve is not None and not debug:
+        _waitress_serve(app, host=host, port=port, threads=8)
+    else:
+        app.run(host=host, port=port, debug=debug, use_reloader=False, threaded=True)
 
 
 if __name__ == "__main__":